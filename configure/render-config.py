@@ -112,6 +112,8 @@ CONFIG_DIR = BASE_DIR / "configure"
 TEMPLATE_FILE = CONFIG_DIR / "config.jsonc.j2"
 OUTPUT_FILE = CONFIG_DIR / "config.jsonc"
 YAML_FILE = CONFIG_DIR / "config.yaml"
+# The libyaml-backed loader is only missing when PyYAML was built without it
+YAML_LOADER = getattr(y, "CSafeLoader", y.SafeLoader)
 DEFAULT_DB = Path.home() / ".local/share/secure_keystore.db"
 DEFAULT_KEY = Path.home() / ".local/share/secure_keystore.key"
 
@@ -166,7 +168,7 @@ def load_yaml(input: Path) -> Configuration:
     if input.exists():
         try:
             with open(input, "r") as f:
-                yaml_data = cast(dict[str, object], y.safe_load(f))
+                yaml_data = cast(dict[str, object], y.load(f, Loader=YAML_LOADER))
                 configuration = from_dict(
                     data_class=Configuration,
                     data=yaml_data,
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 
-import getpass
 import logging
 import os
 import signal
@@ -18,6 +17,8 @@ from waybar.util import system
 cache_dir = system.get_cache_directory()
 context_settings = dict(help_option_names=["-h", "--help"])
 logfile = cache_dir / "waybar.log"
+pidfile = cache_dir / "waybar.pid"
+process_attrs = ["cmdline", "create_time", "name", "pid", "ppid", "username"]
 
 
 class RightPadFormatter(logging.Formatter):
@@ -40,11 +41,14 @@ class RightPadFormatter(logging.Formatter):
 # ----------------------------
 def get_background_scripts() -> list[dict[str, str | list[str] | int | None]]:
     processes: list[dict[str, str | list[str] | int | None]] = []
-    for proc in psutil.process_iter(
-        attrs=["cmdline", "create_time", "name", "pid", "ppid", "username"]
-    ):
+    # The name comes from a single /proc read, so only fetch the remaining
+    # attributes for python processes
+    for proc in psutil.process_iter(attrs=["name"]):
+        if not cast(str, proc.info["name"] or "").startswith("python"):
+            continue
         try:
-            cmdline = cast(list[str], proc.info["cmdline"])
+            info = proc.as_dict(attrs=process_attrs)
+            cmdline = cast(list[str], info["cmdline"])
             cmd_short: str = ""
             if cmdline and len(cmdline) > 0:
                 cmd_str = " ".join(cmdline)
@@ -53,15 +57,15 @@ def get_background_scripts() -> list[dict[str, str | list[str] | int | None]]:
                 if (
                     cmd_str.startswith("python3")
                     and system.get_script_directory() in cmd_str
-                    and proc.info.get("username") == getpass.getuser()
+                    and info.get("username") == system.get_username()
                 ):
-                    created = cast(int, proc.info.get("create_time"))
+                    created = cast(int, info.get("create_time"))
                     new_process = {
                         "cmd_short": cmd_short,
                         "created": created or 0,
-                        "pid": proc.info.get("pid"),
-                        "ppid": proc.info.get("ppid"),
-                        "username": proc.info.get("username"),
+                        "pid": info.get("pid"),
+                        "ppid": info.get("ppid"),
+                        "username": info.get("username"),
                     }
 
                     processes.append(new_process)
@@ -72,27 +76,93 @@ def get_background_scripts() -> list[dict[str, str | list[str] | int | None]]:
     return processes
 
 
+def _cached_waybar_pid() -> int | None:
+    """Return the pid from the pidfile if that process is still waybar"""
+    try:
+        pid = int(pidfile.read_text().strip())
+        os.kill(pid, 0)
+        with open(f"/proc/{pid}/comm") as f:
+            if f.read().strip() != "waybar":
+                return None
+    except (OSError, ValueError):
+        return None
+    return pid
+
+
+def _waybar_process(
+    info: dict[str, object],
+) -> dict[str, str | list[str] | int | None] | None:
+    if info.get("cmdline") is None:
+        return None
+
+    cmdline = cast(list[str], info["cmdline"])
+    cmd = " ".join(cmdline)
+    if cmd == "waybar" and info.get("username") == system.get_username():
+        return {
+            "cmd": cmd,
+            "cmdline": cmdline or [],
+            "created": cast(int, info.get("create_time")),
+            "pid": cast(int, info.get("pid")),
+            "ppid": cast(int, info.get("ppid")),
+            "username": cast(str, info.get("username")),
+            "duration": "",
+        }
+    return None
+
+
+def _waybar_pids() -> list[int]:
+    """
+    Return the pids of the current user's processes named waybar, read from
+    /proc/<pid>/comm. Falls back to psutil's name lookup without /proc.
+    """
+    try:
+        entries = list(os.scandir("/proc"))
+    except FileNotFoundError:
+        return [
+            proc.pid
+            for proc in psutil.process_iter(attrs=["name"])
+            if proc.info["name"] == "waybar"
+        ]
+
+    uid = os.getuid()
+    pids: list[int] = []
+    for entry in entries:
+        if not entry.name.isdigit():
+            continue
+        try:
+            if entry.stat().st_uid != uid:
+                continue
+            with open(f"/proc/{entry.name}/comm") as f:
+                if f.read().strip() == "waybar":
+                    pids.append(int(entry.name))
+        except OSError:
+            continue
+    return pids
+
+
 def waybar_is_running() -> dict[str, str | list[str] | int | None] | None:
-    for proc in psutil.process_iter(
-        attrs=["cmdline", "create_time", "name", "pid", "ppid", "username"]
-    ):
+    # Try the last known pid first so we only scan /proc on a miss
+    pid = _cached_waybar_pid()
+    if pid is not None:
         try:
-            if proc.info.get("cmdline") is not None:
-                cmdline = cast(list[str], proc.info["cmdline"])
-                cmd = " ".join(cmdline)
-                if cmd == "waybar" and proc.info.get("username") == getpass.getuser():
-                    created = cast(int, proc.info.get("create_time"))
-                    return {
-                        "cmd": cmd,
-                        "cmdline": cmdline or [],
-                        "created": created,
-                        "pid": proc.info.get("pid"),
-                        "ppid": proc.info.get("ppid"),
-                        "username": proc.info.get("username"),
-                        "duration": "",
-                    }
+            proc = _waybar_process(psutil.Process(pid).as_dict(attrs=process_attrs))
+            if proc:
+                return proc
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+    # Only the few candidates whose comm matches get the full psutil lookup
+    for pid in _waybar_pids():
+        try:
+            proc = _waybar_process(psutil.Process(pid).as_dict(attrs=process_attrs))
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
+        if proc:
+            try:
+                _ = pidfile.write_text(f"{proc['pid']}\n")
+            except OSError as e:
+                logging.debug(f"failed to write the pid file {pidfile}: {e}")
+            return proc
     return None
 
 
@@ -115,6 +115,7 @@ def generate_tooltip(memory_info: memory_usage.MemoryInfo) -> str:
 def get_dimm_info() -> list[memory_usage.DimmInfo]:
     dimms: list[memory_usage.DimmInfo] = []
     command = "sudo dmidecode -t memory | jc --dmidecode"
+    # HOT PATH: fork/exec
     rc, stdout_raw, _ = system.run_piped_command(command)
 
     stdout = stdout_raw if isinstance(stdout_raw, str) else ""
@@ -140,30 +141,47 @@ def get_dimm_info() -> list[memory_usage.DimmInfo]:
     return dimms
 
 
+def read_meminfo(filename: str = "/proc/meminfo") -> dict[str, int]:
+    """
+    Parse /proc/meminfo directly and return a dict of values in kB.
+    """
+    meminfo: dict[str, int] = {}
+    with open(filename, "r") as fh:
+        for line in fh:
+            key, _, value = line.partition(":")
+            bits = value.split()
+            if bits:
+                meminfo[key] = int(bits[0])
+
+    return meminfo
+
+
 def get_memory_usage() -> memory_usage.MemoryInfo:
     memory_info: memory_usage.MemoryInfo = memory_usage.MemoryInfo()
-    command = "cat /proc/meminfo | jc --pretty --proc-meminfo"
-    rc, stdout_raw, stderr_raw = system.run_piped_command(command)
-
-    stdout = stdout_raw if isinstance(stdout_raw, str) else ""
-    stderr = stderr_raw if isinstance(stderr_raw, str) else ""
-    if rc == 0 and stdout != "":
-        json_data = cast(dict[str, int], json.loads(stdout))
-        available = json_data.get("Available", 0) * 1024
-        buffers = json_data.get("Buffers", 0) * 1024
-        cached = json_data.get("Cached", 0) * 1024
-        free = json_data.get("MemFree", 0) * 1024
-        s_reclaimable = json_data.get("SReclaimable", 0) * 1024
-        shared = json_data.get("Shmem", 0) * 1024
-        total = json_data.get("MemTotal", 0) * 1024
+    filename = "/proc/meminfo"
+    error: str | None = None
+    try:
+        meminfo = read_meminfo(filename=filename)
+    except (OSError, ValueError) as e:
+        meminfo = {}
+        error = str(e)
+
+    if meminfo:
+        available = meminfo.get("MemAvailable", 0) * 1024
+        buffers = meminfo.get("Buffers", 0) * 1024
+        cached = meminfo.get("Cached", 0) * 1024
+        free = meminfo.get("MemFree", 0) * 1024
+        s_reclaimable = meminfo.get("SReclaimable", 0) * 1024
+        shared = meminfo.get("Shmem", 0) * 1024
+        total = meminfo.get("MemTotal", 0) * 1024
         used = total - free - buffers - cached - s_reclaimable
         pct_total = 100
         pct_used = int(((total - available) / total) * 100)
         pct_free = pct_total - pct_used
 
         # Swap
-        swap_total = json_data.get("SwapTotal", 0) * 1024
-        swap_free = json_data.get("SwapFree", 0) * 1024
+        swap_total = meminfo.get("SwapTotal", 0) * 1024
+        swap_free = meminfo.get("SwapFree", 0) * 1024
         swap_used = swap_total - swap_free
         swap_pct_total = 100
         swap_pct_used = int((swap_used / swap_total) * 100)
@@ -194,7 +212,7 @@ def get_memory_usage() -> memory_usage.MemoryInfo:
     else:
         memory_info = memory_usage.MemoryInfo(
             success=False,
-            error=stderr or f'failed to execute "{command}"',
+            error=error or f'failed to read "{filename}"',
         )
 
     return memory_info
@@ -23,6 +23,13 @@ sys.stdout.reconfigure(line_buffering=True)  # type: ignore
 
 cache_dir = system.get_cache_directory()
 context_settings = dict(help_option_names=["-h", "--help"])
+dacite_config = Config(
+    cast=[str, int, float],
+    type_hooks={
+        str: misc.str_hook,
+        int: misc.int_hook,
+    },
+)
 loading = f"{glyphs.md_timer_outline}{glyphs.icon_spacer}Checking USGS..."
 loading_dict = {"text": loading, "class": "loading", "tooltip": "Checking USGS..."}
 logfile = cache_dir / "waybar-earthquakes.log"
@@ -109,10 +116,8 @@ def get_quake_data(radius: str, limit: int, magnitude: float) -> quakes.QuakeDat
                     )
 
                     if response and response.status and response.status == 200:
-                        if response.body:
-                            json_data = cast(
-                                dict[str, object], json.loads(response.body)
-                            )
+                        if isinstance(response.body, dict):
+                            json_data = cast(dict[str, object], response.body)
                             features = cast(
                                 list[dict[str, object]], json_data["features"]
                             )
@@ -122,13 +127,7 @@ def get_quake_data(radius: str, limit: int, magnitude: float) -> quakes.QuakeDat
                                     quake = from_dict(
                                         data_class=quakes.Quake,
                                         data=feature,
-                                        config=Config(
-                                            cast=[str, int, float],
-                                            type_hooks={
-                                                str: misc.str_hook,
-                                                int: misc.int_hook,
-                                            },
-                                        ),
+                                        config=dacite_config,
                                     )
                                     quakes_list.append(quake)
                             except Exception as e:
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 import re
 import signal
 import subprocess
@@ -64,6 +65,14 @@ valid_types = [
 
 format: list[str] = []
 
+# Skip "apt update" when the package lists are fresher than this (in seconds)
+apt_lists_dir = "/var/lib/apt/lists"
+apt_lists_max_age = 3600
+# Touched after every successful "apt update" run from here
+apt_update_stamp = cache_dir / "waybar-software-updates-apt.stamp"
+# Touched by update-notifier-common after any successful "apt update"
+apt_update_success_stamp = "/var/lib/apt/periodic/update-success-stamp"
+
 
 def configure_logging(debug: bool = False):
     logging.basicConfig(
@@ -144,6 +153,7 @@ def execute_command(
     command: list[str], cwd: str | None, shell: bool
 ) -> tuple[int, str | None, str]:
     try:
+        # HOT PATH: fork/exec
         result = subprocess.run(
             command,
             cwd=cwd,
@@ -225,18 +235,54 @@ def find_apk_updates(package_type: str) -> SoftwareUpdates:
     return success(package_type=package_type, packages=packages)
 
 
+def apt_lists_are_stale() -> bool:
+    """
+    Determine whether "apt update" needs to run based on when the package lists
+    were last refreshed. The lists directory's own mtime only changes when apt
+    adds or removes a file, and the list files carry the mirror's timestamps, so
+    the stamp files are checked as well.
+    """
+    last_update = 0.0
+    for path in (apt_update_stamp, apt_update_success_stamp):
+        try:
+            last_update = max(last_update, os.stat(path).st_mtime)
+        except OSError:
+            pass
+
+    try:
+        with os.scandir(apt_lists_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    last_update = max(last_update, entry.stat().st_mtime)
+    except OSError:
+        pass
+
+    return time.time() - last_update >= apt_lists_max_age
+
+
 def find_apt_updates(package_type: str) -> SoftwareUpdates:
     logging.info(f"[find_{package_type}_updates] - entering function")
 
     packages: list[Package] = []
-    command = ["sudo", "apt", "update"]
-    rc, _, stderr = execute_command(command=command, cwd=None, shell=False)
-    if rc != 0:
-        return error(
-            package_type=package_type, command=command, error=stderr or "Unknown error"
-        )
+    if apt_lists_are_stale():
+        command = ["sudo", "apt", "update"]
+        rc, _, stderr = execute_command(command=command, cwd=None, shell=False)
+        if rc != 0:
+            return error(
+                package_type=package_type,
+                command=command,
+                error=stderr or "Unknown error",
+            )
+        try:
+            apt_update_stamp.touch()
+        except OSError as e:
+            logging.error(
+                f"[find_{package_type}_updates] - failed to touch {apt_update_stamp}: {e}"
+            )
+    else:
+        logging.info(f"[find_{package_type}_updates] - package lists are fresh")
 
-    command = ["sudo", "apt", "upgrade", "--simulate", "--quiet"]
+    command = ["apt", "upgrade", "--simulate", "--quiet"]
     rc, stdout, _ = execute_command(command=command, cwd=None, shell=False)
     if rc == 0 and type(stdout) is str:
         lines = [line for line in stdout.split("\n") if line.startswith("Inst")]
@@ -394,7 +440,7 @@ def find_pacman_updates(package_type: str) -> SoftwareUpdates:
             package_type=package_type, command=command, error=stderr or "Unknown error"
         )
 
-    command = ["sudo", "pacman", "-Qu"]
+    command = ["pacman", "-Qu"]
     rc, stdout, stderr = execute_command(command=command, cwd=None, shell=False)
     if rc == 0 and type(stdout) is str:
         for line in stdout.split("\n"):
@@ -413,7 +459,7 @@ def find_snap_updates(package_type: str) -> SoftwareUpdates:
     logging.info(f"[find_{package_type}_updates] - entering function")
 
     packages: list[Package] = []
-    command = ["sudo", "snap", "refresh", "--list"]
+    command = ["snap", "refresh", "--list"]
     rc, stdout, stderr = execute_command(command=command, cwd=None, shell=False)
     if rc == 0 and type(stdout) is str:
         if stdout != "All snaps up to date":
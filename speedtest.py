@@ -1,184 +1,97 @@
 #!/usr/bin/env python3
 
-import json
+import asyncio
+import bisect
 import logging
+import math
 import os
 import re
 import signal
 import socket
-import subprocess
-import sys
+import statistics
 import threading
 import time
 from collections import OrderedDict
+from collections.abc import Coroutine
+from dataclasses import replace
 from datetime import datetime, timezone
 from typing import cast
+from xml.etree import ElementTree
 
+import aiohttp
 import click
-from dacite import Config, from_dict
+import orjson
 
 from waybar import glyphs
 from waybar.data import speedtest
 from waybar.util import conversion, log, network, system, wtime
 
-sys.stdout.reconfigure(line_buffering=True)  # type: ignore
-
 cache_dir = system.get_cache_directory()
 condition = threading.Condition()
 context_settings = dict(help_option_names=["-h", "--help"])
 logfile = cache_dir / "waybar-speedtest.log"
+server_cache = cache_dir / "waybar-speedtest-server.json"
+server_cache_ttl = 3600
+
+# The client config and server list rarely change, so keep them between runs
+config_cache_client: speedtest.Client | None = None
+config_cache_servers: list[speedtest.Server] = []
+config_cache_time: float = 0.0
+config_cache_ttl = 21600
 logger: logging.Logger
 needs_fetch: bool = False
 speedtest_data: speedtest.Results | None = speedtest.Results()
 
+# Speeds below each threshold get the matching icon; anything faster gets the last one
+speed_thresholds = (100_000_000, 500_000_000)
+speed_icons = (
+    glyphs.md_speedometer_slow,
+    glyphs.md_speedometer_medium,
+    glyphs.md_speedometer_fast,
+)
 
-class SpeedTest:
-    global logger
-
-    def __init__(self, **kwargs) -> None:
-        self.success: bool = True
-        self.error: str | None = None
-
-        self.avg_speed: int = 0
-
-        self.results: speedtest.Results = speedtest.Results()
-
-    def _parse_results(self):
-        server_ip: str | None = None
-        client_location: network.LocationData | None = None
-        server_location: network.LocationData | None = None
-
-        self.results.client.loggedin = (
-            True if self.results.client.loggedin == "1" else False
-        )
-        if self.results.client.ispdlavg:
-            self.results.client.ispdlavg = int(self.results.client.ispdlavg)
-
-        if self.results.client.ispulavg:
-            self.results.client.ispulavg = int(self.results.client.ispulavg)
-
-        if self.results.client.isprating:
-            self.results.client.isprating = float(self.results.client.isprating)
-
-        if self.results.client.rating:
-            self.results.client.rating = int(self.results.client.rating)
-
-        if self.results.server.d:
-            self.results.server.d = float(self.results.server.d)
-
-        if self.results.server.id:
-            self.results.server.id = int(self.results.server.id)
-
-        if self.results.client.ip:
-            client_location = network.ip_to_location(ip=self.results.client.ip)
-
-        if self.results.server.host:
-            hostname = self.results.server.host.split(":")[0]
-            try:
-                server_ip = socket.gethostbyname(hostname)
-            except Exception:
-                server_ip = None
-
-        if server_ip:
-            server_location = network.ip_to_location(ip=server_ip)
-            self.results.server.ip = server_ip
-
-        if client_location:
-            self.results.client.city = client_location.city
-            self.results.client.country = client_location.country
-            self.results.client.region = client_location.region
-            self.results.client.timezone = client_location.timezone
-            if client_location.org:
-                self.results.client.isp = client_location.org
-
-        if server_location:
-            self.results.server.city = (
-                server_location.city
-                if server_location.city
-                else re.split(r"\s*,\s*", self.results.server.name)[0] or None
-            )
-            self.results.server.country = (
-                server_location.country
-                if server_location.country
-                else self.results.server.country or None
-            )
-            self.results.server.region = (
-                server_location.region
-                if server_location.region
-                else re.split(r"\s*,\s*", self.results.server.name)[1] or None
-            )
-
-            self.results.server.timezone = server_location.timezone
-
-            self.results.speed_rx = round(self.results.download)
-            self.results.speed_tx = round(self.results.upload)
-
-            self.avg_speed = cast(
-                int, (self.results.speed_rx + self.results.speed_tx) / 2
-            )
-
-            self._get_icon()
-            self.results.success = True
-
-    def _get_icon(self):
-        if self.avg_speed < 100_000_000:
-            self.results.icon = glyphs.md_speedometer_slow
-        elif self.avg_speed < 500_000_000:
-            self.results.icon = glyphs.md_speedometer_medium
-        else:
-            self.results.icon = glyphs.md_speedometer_fast
-
-    def run_speedtest(self):
-        stdout: str = ""
-        stderr: str = ""
-
-        command_list = ["speedtest-cli", "--secure", "--json"]
-        command = " ".join(command_list)
-        runtime = datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat()
-
-        try:
-            result = subprocess.run(
-                command_list, capture_output=True, text=True, check=False
-            )
-            stdout = result.stdout.strip()
-            stderr = result.stderr.strip()
-            rc = result.returncode
-        except Exception as e:
-            return speedtest.Results(
-                success=False,
-                error=stderr or f'failed to execute "{command}": {e}',
-                icon=glyphs.md_alert,
-            )
-
-        if rc == 0 and stdout != "":
-            try:
-                json_data = cast(dict[str, object], json.loads(stdout))
-                # Speedtest timestamp (2025-12-30T16:44:17.640410+00:00Z) is
-                # an invalid format so we fix it here
-                if "timestamp" in json_data:
-                    timestamp = cast(str, json_data["timestamp"])
-                    logger.info(f"runtime = {runtime}")
-                    logger.info(f"timstamp = {timestamp}")
-                    match = re.search(
-                        r"^(\d{4}\-\d{2}\-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(\+\d{2}:\d{2})?)",
-                        timestamp,
-                    )
-                    json_data["timestamp"] = match.group(1) if match else runtime
-
-                self.results = from_dict(
-                    data_class=speedtest.Results,
-                    data=json_data,
-                    config=Config(
-                        cast=[int, float, str],
-                        type_hooks={datetime: datetime.fromisoformat},
-                    ),
-                )
-            except Exception as e:
-                self.success = False
-                self.error = str(e)
-                return
+# Status text keyed by (has download result, has upload result)
+text_formats: dict[tuple[bool, bool], str] = {
+    (True, True): "{icon}{spacer}Speedtest {down}{download} {up}{upload}",
+    (True, False): "{icon}{spacer}Speedtest {down}{download}",
+    (False, True): "{icon}{spacer}Speedtest {up}{upload}",
+    (False, False): "{icon}{spacer}all tests failed",
+}
+
+# Constant status lines, serialized once instead of on every run
+loading_output = orjson.dumps(
+    {
+        "text": f"{glyphs.md_timer_outline}{glyphs.icon_spacer}Speedtest running...",
+        "class": "loading",
+        "tooltip": "Speedtest is running",
+    },
+    option=orjson.OPT_APPEND_NEWLINE,
+)
+unreachable_output = orjson.dumps(
+    {
+        "text": f"{glyphs.md_alert}{glyphs.icon_spacer}the network is unreachable",
+        "class": "error",
+        "tooltip": "Speedtest error",
+    },
+    option=orjson.OPT_APPEND_NEWLINE,
+)
 
-        self._parse_results()
+# speedtest.net legacy HTTP test parameters
+config_url = "https://www.speedtest.net/speedtest-config.php"
+servers_url = "https://www.speedtest.net/speedtest-servers-static.php"
+closest_count = 5
+download_sizes = [350, 500, 750, 1000, 1500, 2000, 2500, 3000, 3500, 4000]
+flows = 8
+latency_samples = 4
+loaded_latency_interval = 0.2
+progress_interval = 1.0
+read_bufsize = 4 << 20
+test_length = 10
+unreachable_latency = 3600 * 1000
+upload_sizes = [32768, 65536, 131072, 262144, 524288, 1048576]
+upload_payload = b"content1=" + (
+    b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ" * (upload_sizes[-1] // 36 + 1)
+)
 
 
 def refresh_handler(_signum: int, _frame: object | None):
@@ -215,6 +128,24 @@ def generate_tooltip(results: speedtest.Results) -> str:
     if results.ping:
         tooltip_od["Ping"] = f"{results.ping} ms"
 
+    if results.ping and results.ping_download_loaded:
+        tooltip_od["Download ping"] = (
+            f"{results.ping_download_loaded} ms "
+            f"(+{max(results.ping_download_loaded - results.ping, 0):.3f} ms)"
+        )
+
+    if results.ping and results.ping_upload_loaded:
+        tooltip_od["Upload ping"] = (
+            f"{results.ping_upload_loaded} ms "
+            f"(+{max(results.ping_upload_loaded - results.ping, 0):.3f} ms)"
+        )
+
+    if results.download_failures or results.upload_failures:
+        tooltip_od["Failed flows"] = (
+            f"{results.download_failures} of {flows} down, "
+            f"{results.upload_failures} of {flows} up"
+        )
+
     max_key_length = 0
     for key in tooltip_od.keys():
         max_key_length = len(key) if len(key) > max_key_length else max_key_length
@@ -280,13 +211,8 @@ def generate_tooltip(results: speedtest.Results) -> str:
     return "\n".join(tooltip)
 
 
-def get_icon(speed: int) -> str:
-    if speed < 100_000_000:
-        return glyphs.md_speedometer_slow
-    elif speed < 500_000_000:
-        return glyphs.md_speedometer_medium
-    else:
-        return glyphs.md_speedometer_fast
+def get_icon(speed: float) -> str:
+    return speed_icons[bisect.bisect_right(speed_thresholds, speed)]
 
 
 def parse_results(results: speedtest.Results) -> speedtest.Results:
@@ -351,49 +277,505 @@ def parse_results(results: speedtest.Results) -> speedtest.Results:
 
         results.server.timezone = server_location.timezone
 
-        results.speed_rx = round(results.download)
-        results.speed_tx = round(results.upload)
-
-        avg_speed = cast(int, (results.speed_rx + results.speed_tx) / 2)
+        results.speed_rx = results.download
+        results.speed_tx = results.upload
 
-        results.icon = get_icon(speed=avg_speed)
+        results.icon = get_icon(speed=(results.speed_rx + results.speed_tx) / 2)
         results.updated = wtime.get_human_timestamp()
         results.success = True
 
     return results
 
 
-def run_speedtest() -> speedtest.Results:
-    # speedtest_results: Results = Results()
-    results: speedtest.Results = speedtest.Results()
-    stdout: str = ""
-    stderr: str = ""
+def distance(origin: tuple[float, float], destination: tuple[float, float]) -> float:
+    """
+    Determine the distance in km between two lat/lon pairs using the haversine formula.
+    """
+    lat1, lon1 = origin
+    lat2, lon2 = destination
+    radius = 6371
+
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat / 2) * math.sin(dlat / 2) + math.cos(
+        math.radians(lat1)
+    ) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) * math.sin(dlon / 2)
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return radius * c
+
+
+def server_base_url(server: speedtest.Server) -> str:
+    """
+    Return the directory portion of a server's upload.php URL over https.
+    """
+    url = server.url or ""
+    if url.startswith("http://"):
+        url = f"https://{url[len('http://') :]}"
+    return url.rsplit("/", 1)[0]
+
+
+async def fetch_client(session: aiohttp.ClientSession) -> speedtest.Client:
+    async with session.get(config_url) as resp:
+        body = await resp.read()
+
+    root = ElementTree.fromstring(body)
+    element = root.find("client")
+    attrs = element.attrib if element is not None else {}
+
+    return speedtest.Client(
+        country=attrs.get("country"),
+        ip=attrs.get("ip"),
+        isp=attrs.get("isp"),
+        ispdlavg=attrs.get("ispdlavg"),
+        isprating=attrs.get("isprating"),
+        ispulavg=attrs.get("ispulavg"),
+        lat=attrs.get("lat"),
+        loggedin=attrs.get("loggedin"),
+        lon=attrs.get("lon"),
+        rating=attrs.get("rating"),
+    )
+
+
+async def fetch_servers(
+    session: aiohttp.ClientSession, client: speedtest.Client
+) -> list[speedtest.Server]:
+    async with session.get(servers_url) as resp:
+        body = await resp.read()
+
+    servers: list[speedtest.Server] = []
+    origin = (float(client.lat or 0), float(client.lon or 0))
+    for element in ElementTree.fromstring(body).iter("server"):
+        attrs = element.attrib
+        try:
+            d = distance(origin, (float(attrs["lat"]), float(attrs["lon"])))
+        except (KeyError, ValueError):
+            continue
+
+        servers.append(
+            speedtest.Server(
+                cc=attrs.get("cc"),
+                country=attrs.get("country"),
+                d=d,
+                host=attrs.get("host"),
+                id=attrs.get("id"),
+                lat=attrs.get("lat"),
+                lon=attrs.get("lon"),
+                name=attrs.get("name", ""),
+                sponsor=attrs.get("sponsor"),
+                url=attrs.get("url"),
+            )
+        )
+
+    return sorted(servers, key=lambda server: cast(float, server.d))
+
+
+async def latency_probe(
+    session: aiohttp.ClientSession, server: speedtest.Server, tag: int
+) -> float | None:
+    """
+    Return the time in ms to fetch latency.txt from the server, or None on failure.
+    """
+    url = f"{server_base_url(server)}/latency.txt?x={time.time_ns()}.{tag}"
+    start = time.monotonic()
+    try:
+        async with session.get(url) as resp:
+            body = await resp.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
+
+    if resp.status == 200 and body.strip() == b"test=test":
+        return (time.monotonic() - start) * 1000
+    return None
+
+
+async def measure_latency(
+    session: aiohttp.ClientSession, server: speedtest.Server
+) -> float:
+    """
+    Return the lowest time in ms to fetch latency.txt from the server.
+    """
+    samples: list[float] = []
+    for i in range(latency_samples):
+        sample = await latency_probe(session=session, server=server, tag=i)
+        if sample is not None:
+            samples.append(sample)
+
+    return round(min(samples), 3) if samples else unreachable_latency
+
+
+async def measure_loaded_latency(
+    session: aiohttp.ClientSession, server: speedtest.Server, done: asyncio.Event
+) -> float:
+    """
+    Sample latency.txt until done is set and return the median time in ms. This
+    runs alongside one transfer phase, so it shows how much latency rises while
+    that direction is loaded.
+    """
+    samples: list[float] = []
+    tag = 0
+    while not done.is_set():
+        sample = await latency_probe(session=session, server=server, tag=tag)
+        if sample is not None:
+            samples.append(sample)
+        tag += 1
+        try:
+            _ = await asyncio.wait_for(done.wait(), timeout=loaded_latency_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    return round(statistics.median(samples), 3) if samples else 0.0
+
+
+async def get_best_server(
+    session: aiohttp.ClientSession, servers: list[speedtest.Server]
+) -> speedtest.Server:
+    """
+    Probe the closest servers concurrently and return the one with the lowest latency.
+    """
+    # Work on copies so the latencies set here and the fields parse_results
+    # fills in later never reach the cached server list
+    candidates = [replace(server) for server in servers[:closest_count]]
+    if not candidates:
+        raise RuntimeError("no speedtest servers found")
+
+    latencies = await asyncio.gather(
+        *[measure_latency(session=session, server=server) for server in candidates]
+    )
+    for server, latency in zip(candidates, latencies):
+        server.latency = latency
+
+    return min(candidates, key=lambda server: server.latency)
+
+
+def config_cache_is_fresh() -> bool:
+    return time.time() - config_cache_time < config_cache_ttl
+
+
+async def get_client(session: aiohttp.ClientSession) -> speedtest.Client:
+    global config_cache_client, config_cache_servers, config_cache_time
+
+    if config_cache_client is None or not config_cache_is_fresh():
+        config_cache_client = await fetch_client(session=session)
+        config_cache_servers = []
+        config_cache_time = time.time()
+
+    return replace(config_cache_client)
+
+
+async def get_servers(
+    session: aiohttp.ClientSession, client: speedtest.Client
+) -> list[speedtest.Server]:
+    global config_cache_servers
+
+    if not config_cache_servers or not config_cache_is_fresh():
+        config_cache_servers = await fetch_servers(session=session, client=client)
 
-    command_list = ["speedtest-cli", "--secure", "--json"]
-    command = " ".join(command_list)
+    return config_cache_servers
 
+
+def load_cached_server() -> speedtest.Server | None:
+    """
+    Return the previously selected server if the cache file is still fresh.
+    """
+    try:
+        if time.time() - os.path.getmtime(server_cache) >= server_cache_ttl:
+            return None
+        return speedtest.Server(**orjson.loads(server_cache.read_bytes()))
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def save_cached_server(server: speedtest.Server):
+    try:
+        # orjson walks the dataclass natively, so no intermediate asdict() copy
+        _ = server_cache.write_bytes(orjson.dumps(server))
+    except OSError as e:
+        logging.error(f"[save_cached_server] - failed to write {server_cache}: {e}")
+
+
+def clear_caches():
+    """
+    Forget the cached client config, server list, and selected server.
+    """
+    global config_cache_client, config_cache_servers, config_cache_time
+
+    config_cache_client = None
+    config_cache_servers = []
+    config_cache_time = 0.0
     try:
-        result = subprocess.run(
-            command_list, capture_output=True, text=True, check=False
+        server_cache.unlink(missing_ok=True)
+    except OSError as e:
+        logging.error(f"[clear_caches] - failed to remove {server_cache}: {e}")
+
+
+async def drain(resp: aiohttp.ClientResponse, progress: speedtest.Progress):
+    """
+    Discard a response body as it arrives, counting the bytes read.
+    """
+    async for chunk in resp.content.iter_any():
+        progress.bytes_received += len(chunk)
+
+
+async def download_flow(
+    session: aiohttp.ClientSession,
+    urls: list[str],
+    deadline: float,
+    progress: speedtest.Progress,
+):
+    for url in urls:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        # Bytes are counted as they arrive, so a download cut off at the
+        # deadline still counts what it received. A failed request ends only
+        # this flow; the others keep measuring
+        try:
+            async with asyncio.timeout(remaining):
+                async with session.get(url) as resp:
+                    if resp.status != 200:
+                        logging.warning(
+                            f"[download_flow] - {url} returned HTTP {resp.status}"
+                        )
+                        progress.download_failures += 1
+                        break
+                    await drain(resp=resp, progress=progress)
+        except aiohttp.ClientError as e:
+            logging.warning(f"[download_flow] - {url} failed: {e!r}")
+            progress.download_failures += 1
+            break
+        except TimeoutError:
+            break
+
+
+async def upload_flow(
+    session: aiohttp.ClientSession,
+    url: str,
+    deadline: float,
+    progress: speedtest.Progress,
+):
+    for size in upload_sizes:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        # An upload cut off at the deadline or rejected by the server is not
+        # counted. A failed request ends only this flow
+        try:
+            async with asyncio.timeout(remaining):
+                async with session.post(url, data=upload_payload[:size]) as resp:
+                    _ = await resp.read()
+                    if resp.status != 200:
+                        logging.warning(
+                            f"[upload_flow] - {url} returned HTTP {resp.status}"
+                        )
+                        progress.upload_failures += 1
+                        break
+        except aiohttp.ClientError as e:
+            logging.warning(f"[upload_flow] - {url} failed: {e!r}")
+            progress.upload_failures += 1
+            break
+        except TimeoutError:
+            break
+        progress.bytes_sent += size
+
+
+async def download(
+    session: aiohttp.ClientSession,
+    server: speedtest.Server,
+    progress: speedtest.Progress,
+) -> tuple[int, float]:
+    """
+    Download from the server over several parallel flows and return the bytes
+    received and the number of bits per second.
+    """
+    base_url = server_base_url(server)
+    start = time.monotonic()
+    progress.phase_start = start
+    deadline = start + test_length
+    _ = await asyncio.gather(
+        *[
+            download_flow(
+                session=session,
+                urls=[
+                    f"{base_url}/random{size}x{size}.jpg?x={time.time_ns()}.{i}"
+                    for size in download_sizes
+                ],
+                deadline=deadline,
+                progress=progress,
+            )
+            for i in range(flows)
+        ]
+    )
+    received = progress.bytes_received
+    progress.download_speed = received * 8 / (time.monotonic() - start)
+
+    return received, progress.download_speed
+
+
+async def upload(
+    session: aiohttp.ClientSession,
+    server: speedtest.Server,
+    progress: speedtest.Progress,
+) -> tuple[int, float]:
+    """
+    Upload to the server over several parallel flows and return the bytes
+    sent and the number of bits per second.
+    """
+    url = f"{server_base_url(server)}/upload.php"
+    start = time.monotonic()
+    progress.phase_start = start
+    deadline = start + test_length
+    _ = await asyncio.gather(
+        *[
+            upload_flow(session=session, url=url, deadline=deadline, progress=progress)
+            for _ in range(flows)
+        ]
+    )
+    sent = progress.bytes_sent
+
+    return sent, sent * 8 / (time.monotonic() - start)
+
+
+async def report_progress(progress: speedtest.Progress, done: asyncio.Event):
+    """
+    Emit the running transfer rates every progress_interval seconds until done is set.
+    """
+    while True:
+        try:
+            _ = await asyncio.wait_for(done.wait(), timeout=progress_interval)
+            return
+        except asyncio.TimeoutError:
+            pass
+
+        # Each phase is timed from its own start; once download finishes its
+        # final rate is shown while upload runs
+        elapsed = max(time.monotonic() - progress.phase_start, 1e-3)
+        download_speed = (
+            progress.download_speed or progress.bytes_received * 8 / elapsed
+        )
+        text = text_formats[(True, True)].format(
+            icon=glyphs.md_timer_outline,
+            spacer=glyphs.icon_spacer,
+            down=glyphs.cod_arrow_small_down,
+            up=glyphs.cod_arrow_small_up,
+            download=network.network_speed(number=download_speed, bytes=False),
+            upload=network.network_speed(
+                number=progress.bytes_sent * 8 / elapsed, bytes=False
+            ),
+        )
+        system.emit(
+            {"text": text, "class": "loading", "tooltip": "Speedtest is running"}
         )
-        stdout = result.stdout.strip()
-        stderr = result.stderr.strip()
-        rc = result.returncode
+
+
+async def run_phase(
+    session: aiohttp.ClientSession,
+    server: speedtest.Server,
+    phase: Coroutine[object, object, tuple[int, float]],
+) -> tuple[int, float, float]:
+    """
+    Run one transfer phase with its own loaded latency probe and return the
+    bytes moved, the number of bits per second, and the median latency in ms.
+    """
+    done = asyncio.Event()
+    probe = asyncio.create_task(
+        measure_loaded_latency(session=session, server=server, done=done)
+    )
+    try:
+        transferred, speed = await phase
+    finally:
+        done.set()
+
+    return transferred, speed, await probe
+
+
+async def run_speedtest_async(live: bool = False) -> speedtest.Results:
+    # One connection per flow plus one for the loaded latency probe
+    connector = aiohttp.TCPConnector(limit=flows + 1)
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=10)
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=timeout, read_bufsize=read_bufsize
+    ) as session:
+        client = await get_client(session=session)
+        server = load_cached_server()
+        if server:
+            server.latency = await measure_latency(session=session, server=server)
+            if server.latency >= unreachable_latency:
+                # The cached server stopped answering, so pick a new one
+                logging.warning(
+                    f"[run_speedtest_async] - cached server {server.id} is unreachable"
+                )
+                clear_caches()
+                server = None
+        if server is None:
+            servers = await get_servers(session=session, client=client)
+            server = await get_best_server(session=session, servers=servers)
+            save_cached_server(server=server)
+
+        done = asyncio.Event()
+        progress = speedtest.Progress()
+        reporter = (
+            asyncio.create_task(report_progress(progress=progress, done=done))
+            if live
+            else None
+        )
+        try:
+            # The phases run one after the other so neither is measured while
+            # the other direction is loading the link, and each gets its own
+            # loaded latency so bufferbloat in either direction shows up
+            bytes_received, download_speed, ping_download_loaded = await run_phase(
+                session=session,
+                server=server,
+                phase=download(session=session, server=server, progress=progress),
+            )
+            bytes_sent, upload_speed, ping_upload_loaded = await run_phase(
+                session=session,
+                server=server,
+                phase=upload(session=session, server=server, progress=progress),
+            )
+        finally:
+            done.set()
+        if reporter:
+            await reporter
+
+    # Failed flows are reported separately, so a phase where some flows broke
+    # is not mistaken for one that moved no data at all
+    if progress.download_failures or progress.upload_failures:
+        logging.warning(
+            f"[run_speedtest_async] - {progress.download_failures} of {flows} download "
+            f"and {progress.upload_failures} of {flows} upload flows failed"
+        )
+
+    return speedtest.Results(
+        bytes_received=bytes_received,
+        bytes_sent=bytes_sent,
+        client=client,
+        download=download_speed,
+        download_failures=progress.download_failures,
+        ping=server.latency,
+        ping_download_loaded=ping_download_loaded,
+        ping_upload_loaded=ping_upload_loaded,
+        server=server,
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        upload=upload_speed,
+        upload_failures=progress.upload_failures,
+    )
+
+
+def run_speedtest(fresh: bool = False, live: bool = False) -> speedtest.Results:
+    if fresh:
+        clear_caches()
+
+    try:
+        results = asyncio.run(run_speedtest_async(live=live))
     except Exception as e:
+        logging.error(f"[run_speedtest] - speedtest failed: {e}")
         return speedtest.Results(
             success=False,
-            error=stderr or f'failed to execute "{command}": {e}',
+            error=f"speedtest failed: {e}",
             icon=glyphs.md_alert,
         )
 
-    if rc == 0 and stdout != "":
-        json_data = cast(dict[str, object], json.loads(stdout))
-        results = from_dict(
-            data_class=speedtest.Results,
-            data=json_data,
-            config=Config(cast=[int, float, str]),
-        )
-
     speedtest_results = parse_results(results=results)
     return speedtest_results
 
@@ -405,22 +787,19 @@ def render_output(speedtest_data: speedtest.Results, icon: str) -> tuple[str, st
     tooltip: str = ""
 
     if speedtest_data.success:
-        parts: list[str] = []
-        if speedtest_data.speed_rx:
-            parts.append(
-                f"{glyphs.cod_arrow_small_down}{network.network_speed(number=speedtest_data.speed_rx, bytes=False)}"
-            )
-        if speedtest_data.speed_tx:
-            parts.append(
-                f"{glyphs.cod_arrow_small_up}{network.network_speed(number=speedtest_data.speed_tx, bytes=False)}"
-            )
-
-        if len(parts) == 2:
-            text = f"{icon}{glyphs.icon_spacer}Speedtest {' '.join(parts)}"
+        key = (bool(speedtest_data.speed_rx), bool(speedtest_data.speed_tx))
+        text = text_formats[key].format(
+            icon=icon,
+            spacer=glyphs.icon_spacer,
+            down=glyphs.cod_arrow_small_down,
+            up=glyphs.cod_arrow_small_up,
+            download=network.network_speed(number=speedtest_data.speed_rx, bytes=False),
+            upload=network.network_speed(number=speedtest_data.speed_tx, bytes=False),
+        )
+        if any(key):
             output_class = "success"
             tooltip = generate_tooltip(results=speedtest_data)
         else:
-            text = f"{icon}{glyphs.icon_spacer}all tests failed"
             output_class = "error"
             tooltip = "Speedtest error"
     else:
@@ -431,71 +810,34 @@ def render_output(speedtest_data: speedtest.Results, icon: str) -> tuple[str, st
     return text, output_class, tooltip
 
 
-def worker():
+def worker(interval: int, fresh: bool = False):
     global speedtest_data, needs_fetch
 
     while True:
+        # SIGHUP and the interval timer both wake this single wait
         with condition:
-            while not needs_fetch:
-                _ = condition.wait()
-
-            fetch = needs_fetch
+            _ = condition.wait_for(lambda: needs_fetch, timeout=interval)
             needs_fetch = False
 
         if not network.network_is_reachable():
-            print(
-                json.dumps(
-                    {
-                        "text": f"{glyphs.md_alert}{glyphs.icon_spacer}the network is unreachable",
-                        "class": "error",
-                        "tooltip": "Speedtest error",
-                    }
-                )
-            )
+            system.emit(unreachable_output)
             continue
 
-        if fetch:
-            loading = (
-                f"{glyphs.md_timer_outline}{glyphs.icon_spacer}Speedtest running..."
+        # Show the previous results in the loading state while the test runs
+        if speedtest_data and speedtest_data.success:
+            text, _, tooltip = render_output(
+                speedtest_data=speedtest_data, icon=glyphs.md_timer_outline
             )
-            loading_dict = {
-                "text": loading,
-                "class": "loading",
-                "tooltip": "Speedtest is running",
-            }
-
-            if (
-                speedtest_data
-                and type(speedtest_data) is speedtest.Results
-                and speedtest_data.success
-            ):
-                text, _, tooltip = render_output(
-                    speedtest_data=speedtest_data, icon=glyphs.md_timer_outline
-                )
-                print(
-                    json.dumps({"text": text, "class": "loading", "tooltip": tooltip})
-                )
-            else:
-                print(json.dumps(loading_dict))
-
-            speedtest_data = run_speedtest()
+            system.emit({"text": text, "class": "loading", "tooltip": tooltip})
+        else:
+            system.emit(loading_output)
 
-        if speedtest_data is None:
-            continue
+        speedtest_data = run_speedtest(fresh=fresh, live=True)
 
-        if speedtest_data and type(speedtest_data) is speedtest.Results:
-            text, output_class, tooltip = render_output(
-                speedtest_data=speedtest_data, icon=speedtest_data.icon
-            )
-            print(
-                json.dumps(
-                    {
-                        "text": text,
-                        "class": output_class,
-                        "tooltip": tooltip,
-                    }
-                )
-            )
+        text, output_class, tooltip = render_output(
+            speedtest_data=speedtest_data, icon=speedtest_data.icon
+        )
+        system.emit({"text": text, "class": output_class, "tooltip": tooltip})
 
 
 @click.command(
@@ -508,8 +850,15 @@ def worker():
 @click.option(
     "-t", "--test", default=False, is_flag=True, help="Print the output and exit"
 )
+@click.option(
+    "-f",
+    "--fresh",
+    default=False,
+    is_flag=True,
+    help="Ignore the cached config and server and probe them again",
+)
 @click.option("-d", "--debug", default=False, is_flag=True, help="Enable debug logging")
-def main(interval: int, test: bool, debug: bool):
+def main(interval: int, test: bool, fresh: bool, debug: bool):
     global formats, logger, needs_fetch
 
     logger = log.configure(
@@ -517,7 +866,7 @@ def main(interval: int, test: bool, debug: bool):
     )
 
     if test:
-        speedtest_data = run_speedtest()
+        speedtest_data = run_speedtest(fresh=fresh)
         text, output_class, tooltip = render_output(
             speedtest_data=speedtest_data, icon=speedtest_data.icon
         )
@@ -528,17 +877,10 @@ def main(interval: int, test: bool, debug: bool):
 
     logging.info("[main] - entering function")
 
-    threading.Thread(target=worker, args=(), daemon=True).start()
-
     with condition:
         needs_fetch = True
-        condition.notify()
 
-    while True:
-        time.sleep(interval)
-        with condition:
-            needs_fetch = True
-            condition.notify()
+    worker(interval=interval, fresh=fresh)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-import json
+import hashlib
 import logging
 import os
 import re
@@ -9,10 +9,12 @@ import sys
 import threading
 import time
 from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime, timezone
-from typing import Tuple, cast
+from typing import Tuple, TypeVar, cast
 
 import click
+import orjson
 from dacite import Config, from_dict
 from yahooquery import Ticker
 
@@ -20,25 +22,103 @@ from waybar import glyphs
 from waybar.data import stock_quotes
 from waybar.util import conversion, log, network, system, wtime
 
-sys.stdout.reconfigure(line_buffering=True)  # type: ignore
-
 
 DEFAULT_SYMBOLS = ["GOOG", "AAPL"]
 
 cache_dir = system.get_cache_directory()
 condition = threading.Condition()
 context_settings = dict(help_option_names=["-h", "--help"])
+# The Yahoo! Finance payloads are trusted, so skip dacite's per-field isinstance checks
+dacite_config = Config(
+    type_hooks={datetime: wtime.parse_iso_datetime}, check_types=False
+)
+# Decoded models keyed by (model, symbol), each stored with a digest of its payload
+decode_cache: dict[tuple[type, str], tuple[bytes, object]] = {}
 format_index: int = 0
+# Low-cardinality string fields that repeat across every symbol in the watchlist
+interned_fields: dict[type, tuple[str, ...]] = {
+    stock_quotes.FinancialData: ("financialCurrency", "recommendationKey"),
+    stock_quotes.Price: (
+        "currency",
+        "currencySymbol",
+        "exchange",
+        "exchangeName",
+        "marketState",
+        "quoteSourceName",
+        "quoteType",
+    ),
+    stock_quotes.Quotes: (
+        "currency",
+        "exchange",
+        "exchangeTimezoneName",
+        "exchangeTimezoneShortName",
+        "financialCurrency",
+        "fullExchangeName",
+        "market",
+        "marketState",
+        "quoteSourceName",
+        "quoteType",
+        "region",
+    ),
+    stock_quotes.SummaryDetail: ("currency",),
+}
 logfile = cache_dir / "waybar-stock-quotes.log"
 logger: logging.Logger
 needs_fetch: bool = False
 needs_redraw: bool = False
+# Only the Yahoo! Finance modules the output and tooltip actually read
+quote_modules = [
+    "assetProfile",
+    "defaultKeyStatistics",
+    "financialData",
+    "price",
+    "summaryDetail",
+    "summaryProfile",
+]
 
 formats: list[int] = []
 
+T = TypeVar("T")
+
 update_event = threading.Event()
 
 
+def decode_cached(
+    data_class: type[T],
+    symbol: str,
+    data: dict,
+    prepare: Callable[[T], None] | None = None,
+) -> T:
+    """
+    Build data_class from data, reusing the previous result for this symbol
+    when the payload has not changed since the last refresh. prepare runs once
+    on each newly built model, so a cached model is never modified afterwards.
+    """
+    digest = hashlib.blake2b(
+        orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS),
+        digest_size=16,
+    ).digest()
+    cached = decode_cache.get((data_class, symbol))
+    if cached and cached[0] == digest:
+        return cast(T, cached[1])
+
+    result = from_dict(data_class=data_class, data=data, config=dacite_config)
+    if prepare:
+        prepare(result)
+    decode_cache[(data_class, symbol)] = (digest, result)
+    return result
+
+
+def intern_strings(model: object):
+    """
+    Intern the model's low-cardinality string fields so all symbols share one copy.
+    """
+    for name in interned_fields.get(type(model), ()):
+        value = getattr(model, name)
+        if isinstance(value, str):
+            setattr(model, name, sys.intern(value))
+
+
 class StockQuotes:
     global logger
 
@@ -62,6 +142,19 @@ class StockQuotes:
             return "-".join(parts)
         return phone_number
 
+    def _prepare_modules(self, all_modules: stock_quotes.AllModules):
+        for model in (
+            all_modules.financialData,
+            all_modules.price,
+            all_modules.summaryDetail,
+        ):
+            intern_strings(model)
+
+        if all_modules.assetProfile.phone:
+            all_modules.assetProfile.phone = self._sanitize_phone_number(
+                phone_number=all_modules.assetProfile.phone
+            )
+
     def _get_change_and_change_percent(
         self, current: float, previous: float
     ) -> Tuple[str, str]:
@@ -137,8 +230,8 @@ class StockQuotes:
             return
 
         self.logger.info("refreshing data")
-        quotes_dict = cast(dict[str, dict], self.ticker.all_modules)
-        for symbol, data in quotes_dict.items():
+        modules_dict = cast(dict[str, dict], self.ticker.get_modules(quote_modules))
+        for symbol, data in modules_dict.items():
             # Preprocess some stuff that dataclass doesn't like
             try:
                 if "52WeekChange" in data["defaultKeyStatistics"]:
@@ -149,7 +242,9 @@ class StockQuotes:
             except Exception:
                 pass
 
-            for idx, trend_item in enumerate(data["earningsTrend"]["trend"]):
+            for idx, trend_item in enumerate(
+                data.get("earningsTrend", {}).get("trend", [])
+            ):
                 if "epsTrend" in data["earningsTrend"]["trend"][idx]:
                     old_eps_trend = data["earningsTrend"]["trend"][idx]["epsTrend"]
                     try:
@@ -164,15 +259,12 @@ class StockQuotes:
                     except Exception:
                         pass
 
-            all_modules = from_dict(
+            all_modules = decode_cached(
                 data_class=stock_quotes.AllModules,
+                symbol=symbol,
                 data=data,
-                config=Config(type_hooks={datetime: datetime.fromisoformat}),
+                prepare=self._prepare_modules,
             )
-            if all_modules.assetProfile.phone:
-                all_modules.assetProfile.phone = self._sanitize_phone_number(
-                    phone_number=all_modules.assetProfile.phone
-                )
 
             quotes_map[symbol] = stock_quotes.QuoteData(
                 symbol=symbol,
@@ -208,24 +300,16 @@ class StockQuotes:
                 upgradeDowngradeHistory=all_modules.upgradeDowngradeHistory,
             )
 
-            quotes_dict = cast(dict[str, dict], self.ticker.quotes)
-            if quotes_map[symbol]:
-                for symbol, item in quotes_dict.items():
-                    quotes = from_dict(
-                        data_class=stock_quotes.Quotes,
-                        data=cast(dict, item),
-                        config=Config(type_hooks={datetime: datetime.fromisoformat}),
-                    )
-                    quotes_map[symbol].quotes = quotes
-
-            for symbol, item in self.ticker.technical_insights.items():
-                if quotes_map[symbol]:
-                    technical_insights = from_dict(
-                        data_class=stock_quotes.TechnicalInsights,
-                        data=cast(dict, item),
-                        config=Config(type_hooks={datetime: datetime.fromisoformat}),
-                    )
-                    quotes_map[symbol].technicalInsights = technical_insights
+        # This response already covers every symbol, so fetch and decode it once
+        quotes_dict = cast(dict[str, dict], self.ticker.quotes)
+        for symbol, item in quotes_dict.items():
+            if symbol in quotes_map:
+                quotes_map[symbol].quotes = decode_cached(
+                    data_class=stock_quotes.Quotes,
+                    symbol=symbol,
+                    data=cast(dict, item),
+                    prepare=intern_strings,
+                )
 
         for symbol, data in quotes_map.items():
             if (
@@ -259,8 +343,7 @@ class StockQuotes:
         self.logger.info("refresh complete")
         self.updated = wtime.get_human_timestamp()
 
-        for _, quote in quotes_map.items():
-            self.data.append(quote)
+        self.data = list(quotes_map.values())
 
 
 quotes: StockQuotes = StockQuotes()
@@ -640,7 +723,7 @@ def worker(symbols: list[str]):
                 "class": "error",
                 "tooltip": "Stock quote update error",
             }
-            print(json.dumps(output))
+            system.emit(output)
             continue
 
         if fetch:
@@ -654,19 +737,10 @@ def worker(symbols: list[str]):
             }
 
             if quotes.data and type(quotes.data) is list and len(quotes.data) > 0:
-                text, output_class, tooltip = render_output(
-                    icon=glyphs.md_timer_outline
-                )
-                output = {
-                    "text": text,
-                    "class": output_class,
-                    "tooltip": tooltip,
-                }
-                print(
-                    json.dumps({"text": text, "class": "loading", "tooltip": tooltip})
-                )
+                text, _, tooltip = render_output(icon=glyphs.md_timer_outline)
+                system.emit({"text": text, "class": "loading", "tooltip": tooltip})
             else:
-                print(json.dumps(loading_dict))
+                system.emit(loading_dict)
 
             quotes.get_quotes()
 
@@ -681,7 +755,7 @@ def worker(symbols: list[str]):
                     "class": output_class,
                     "tooltip": tooltip,
                 }
-                print(json.dumps(output))
+                system.emit(output)
 
 
 @click.command(
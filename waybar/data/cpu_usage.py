@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheValues:
     associativity: str | None = None
     configuration: str | None = None
@@ -17,7 +17,7 @@ class CacheValues:
     system_type: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CpuCache:
     handle: str | None = None
     type: int = 0
@@ -26,7 +26,7 @@ class CpuCache:
     values: CacheValues = field(default_factory=CacheValues)
 
 
-@dataclass
+@dataclass(slots=True)
 class CoreInfo:
     tlb_size: str | None = None
     address_sizes: str | None = None
@@ -61,7 +61,7 @@ class CoreInfo:
     wp: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CorePercent:
     cpu: str | None = None
     percent_usr: float = 0.0
@@ -78,7 +78,7 @@ class CorePercent:
     timestamp: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CpuInfo:
     success: bool = False
     error: str | None = None
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class DFEntry:
     available: int = 0
     blocks: int = 0
@@ -13,7 +13,7 @@ class DFEntry:
     used: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class KvOptions:
     discard: str | None = None
     space_cache: str | None = None
@@ -21,7 +21,7 @@ class KvOptions:
     subvol: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FindMount:
     target: str | None = None
     source: str | None = None
@@ -30,7 +30,7 @@ class FindMount:
     kv_options: KvOptions = field(default_factory=KvOptions)
 
 
-@dataclass
+@dataclass(slots=True)
 class DiskStatsSample:
     device: str | None = None
     discarding_time_ms: int = 0
@@ -54,7 +54,7 @@ class DiskStatsSample:
     writes_merged: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockDevice:
     alignment: int = 0
     dax: bool = False
@@ -129,7 +129,7 @@ class BlockDevice:
     zoned: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FilesystemInfo:
     success: bool = False
     error: str | None = None
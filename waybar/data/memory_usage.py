@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class DimmValues:
     array_handle: str | None = None
     asset_tag: str | None = None
@@ -38,7 +38,7 @@ class DimmValues:
     volatile_size: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DimmInfo:
     bytes: int = 0
     description: str | None = None
@@ -47,7 +47,7 @@ class DimmInfo:
     values: DimmValues = field(default_factory=DimmValues)
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryInfo:
     success: bool = False
     error: str | None = None
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Sample:
     interface: str | None = None
     r_bytes: int = 0
@@ -22,7 +22,7 @@ class Sample:
     t_compressed: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkThroughput:
     success: bool = False
     error: str | None = None
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class QuakeProperties:
     alert: str | None = None
     cdi: float | None = 0.0
@@ -31,13 +31,13 @@ class QuakeProperties:
     url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QuakeGeometry:
     type: str | None = None
     coordinates: list[float] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Quake:
     geometry: QuakeGeometry = field(default_factory=QuakeGeometry)
     id: str | None = None
@@ -45,7 +45,7 @@ class Quake:
     type: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QuakeData:
     success: bool = False
     error: str | None = None
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Server:
     cc: str | None = None
     city: str | None = None
@@ -20,7 +20,7 @@ class Server:
     url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Client:
     city: str | None = None
     country: str | None = None
@@ -37,7 +37,17 @@ class Client:
     timezone: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
+class Progress:
+    bytes_received: int = 0
+    bytes_sent: int = 0
+    download_failures: int = 0
+    download_speed: float = 0.0
+    phase_start: float = 0.0
+    upload_failures: int = 0
+
+
+@dataclass(slots=True)
 class Results:
     success: bool = False
     error: str | None = None
@@ -46,11 +56,14 @@ class Results:
     bytes_sent: float = 0.0
     client: Client = field(default_factory=Client)
     download: float = 0.0
+    download_failures: int = 0
     ping: float = 0.0
+    ping_download_loaded: float = 0.0
+    ping_upload_loaded: float = 0.0
     server: Server = field(default_factory=Server)
-    share: str | None = None
     speed_rx: float = 0.0
     speed_tx: float = 0.0
     timestamp: str = ""
     updated: str | None = None
     upload: float = 0.0
+    upload_failures: int = 0
@@ -3,7 +3,7 @@ from datetime import datetime
 
 
 # Common
-@dataclass
+@dataclass(slots=True, eq=False)
 class CompanyOfficer:
     age: int = 0
     exercisedValue: int = 0
@@ -17,7 +17,7 @@ class CompanyOfficer:
 
 
 # Asset Profile
-@dataclass
+@dataclass(slots=True, eq=False)
 class AssetProfile:
     address1: str | None = None
     city: str | None = None
@@ -41,24 +41,24 @@ class AssetProfile:
 
 
 # Balance Sheet History
-@dataclass
+@dataclass(slots=True, eq=False)
 class BalanceSheetStatement:
     maxAge: int = 0
     endDate: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BalanceSheetHistory:
     balanceSheetStatements: list[BalanceSheetStatement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BalanceSheetHistoryQuarterly:
     balanceSheetStatements: list[BalanceSheetStatement] = field(default_factory=list)
 
 
 # Calendar Events
-@dataclass
+@dataclass(slots=True, eq=False)
 class EarningsCalendar:
     earningsDate: list[str] = field(default_factory=list)
     earningsAverage: float = 0.0
@@ -71,7 +71,7 @@ class EarningsCalendar:
     isEarningsDateEstimate: bool = False
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class CalendarEvents:
     maxAge: int = 0
     earnings: EarningsCalendar = field(default_factory=EarningsCalendar)
@@ -80,25 +80,25 @@ class CalendarEvents:
 
 
 # Cash Flow Statement History
-@dataclass
+@dataclass(slots=True, eq=False)
 class CashFlowStatement:
     maxAge: int = 0
     endDate: datetime | None = None
     netIncome: int = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class CashFlowStatementHistory:
     cashflowStatements: list[CashFlowStatement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class CashFlowStatementHistoryQuarterly:
     cashflowStatements: list[CashFlowStatement] = field(default_factory=list)
 
 
 # Default Key Statistics
-@dataclass
+@dataclass(slots=True, eq=False, kw_only=True)
 class DefaultKeyStatistics:
     fiftyTwoWeekChange: float = 0.0
     SandP52WeekChange: float = 0.0
@@ -143,7 +143,7 @@ class DefaultKeyStatistics:
 
 
 # Earnings
-@dataclass
+@dataclass(slots=True, eq=False)
 class QuarterlyData:
     date: str | None = None
     actual: float = 0.0
@@ -154,7 +154,7 @@ class QuarterlyData:
     surprisePct: float | str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class EarningsChart:
     maxAge: int = 0
     quarterly: list[QuarterlyData] = field(default_factory=list)
@@ -167,14 +167,14 @@ class EarningsChart:
     isEarningsDateEstimate: bool = False
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class FinancialsChartYearly:
     date: int = 0
     revenue: int = 0
     earnings: int = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class FinancialsChartQuarterly:
     date: str | None = None
     fiscalQuarter: str | None = None
@@ -182,13 +182,13 @@ class FinancialsChartQuarterly:
     earnings: int = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class FinancialsChart:
     yearly: list[FinancialsChartYearly] = field(default_factory=list)
     quarterly: list[FinancialsChartQuarterly] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Earnings:
     maxAge: int = 0
     earningsChart: EarningsChart = field(default_factory=EarningsChart)
@@ -198,7 +198,7 @@ class Earnings:
 
 
 # Earnings History
-@dataclass
+@dataclass(slots=True, eq=False)
 class EarningsHistoryItem:
     maxAge: int = 0
     epsActual: float = 0.0
@@ -210,7 +210,7 @@ class EarningsHistoryItem:
     period: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class EarningsHistory:
     history: list[EarningsHistoryItem] = field(default_factory=list)
     defaultMethodology: str | None = None
@@ -218,7 +218,7 @@ class EarningsHistory:
 
 
 # Earnings Trend
-@dataclass
+@dataclass(slots=True, eq=False)
 class EarningsEstimate:
     avg: float = 0.0
     earningsCurrency: str | None = None
@@ -229,7 +229,7 @@ class EarningsEstimate:
     yearAgoEps: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class EpsRevisions:
     downLast30days: int = 0
     downLast7Days: int = 0
@@ -239,7 +239,7 @@ class EpsRevisions:
     upLast7days: int = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class EpsTrend:
     thirtyDaysAgo: float = 0.0
     sixtyDaysAgo: float = 0.0
@@ -249,7 +249,7 @@ class EpsTrend:
     epsTrendCurrency: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class RevenueEstimate:
     avg: int = 0
     growth: float = 0.0
@@ -260,7 +260,7 @@ class RevenueEstimate:
     yearAgoRevenue: int = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Trend:
     maxAge: int = 0
     period: str | None = None
@@ -272,7 +272,7 @@ class Trend:
     epsRevisions: EpsRevisions = field(default_factory=EpsRevisions)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class EarningsTrend:
     trend: list[Trend] = field(default_factory=list)
     defaultMethodology: str | None = None
@@ -280,7 +280,7 @@ class EarningsTrend:
 
 
 # Financial Data
-@dataclass
+@dataclass(slots=True, eq=False, kw_only=True)
 class FinancialData:
     currentPrice: float = 0.0
     currentRatio: float = 0.0
@@ -315,7 +315,7 @@ class FinancialData:
 
 
 # Fund Ownership
-@dataclass
+@dataclass(slots=True, eq=False)
 class FundOwner:
     maxAge: int = 0
     reportDate: datetime | None = None
@@ -326,7 +326,7 @@ class FundOwner:
     pctChange: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class FundOwnership:
     maxAge: int = 0
     ownershipList: list[FundOwner] = field(default_factory=list)
@@ -340,13 +340,13 @@ class FundOwnership:
 
 
 # Index Trend
-@dataclass
+@dataclass(slots=True, eq=False)
 class IndexTrendEstimate:
     period: str | None = None
     growth: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class IndexTrend:
     maxAge: int = 0
     symbol: str | None = None
@@ -354,20 +354,20 @@ class IndexTrend:
 
 
 # Industry Trend
-@dataclass
+@dataclass(slots=True, eq=False)
 class IndustryTrendEstimate:
     period: str | None = None
     growth: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class IndustryTrend:
     maxAge: int = 0
     symbol: str | None = None
     estimates: list[IndustryTrendEstimate] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class InsiderHolder:
     latestTransDate: datetime | None = None
     maxAge: int = 0
@@ -379,14 +379,14 @@ class InsiderHolder:
     url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class InsiderHolders:
     holders: list[InsiderHolder] = field(default_factory=list)
     maxAge: int = 0
 
 
 # Insider Transactions
-@dataclass
+@dataclass(slots=True, eq=False)
 class InsiderTransaction:
     maxAge: int = 0
     shares: int = 0
@@ -400,14 +400,14 @@ class InsiderTransaction:
     ownership: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class InsiderTransactions:
     transactions: list[InsiderTransaction] = field(default_factory=list)
     maxAge: int = 0
 
 
 # Institution Ownership
-@dataclass
+@dataclass(slots=True, eq=False)
 class InstitutionOwner:
     maxAge: int = 0
     reportDate: datetime | None = None
@@ -418,14 +418,14 @@ class InstitutionOwner:
     pctChange: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class InstitutionOwnership:
     maxAge: int = 0
     ownershipList: list[InstitutionOwner] = field(default_factory=list)
 
 
 # Major Holders Breakdown
-@dataclass
+@dataclass(slots=True, eq=False)
 class MajorHoldersBreakdown:
     maxAge: int = 0
     insidersPercentHeld: float = 0.0
@@ -435,7 +435,7 @@ class MajorHoldersBreakdown:
 
 
 # Net Share Purchase Activity
-@dataclass
+@dataclass(slots=True, eq=False)
 class NetSharePurchaseActivity:
     maxAge: int = 0
     period: str | None = None
@@ -452,7 +452,7 @@ class NetSharePurchaseActivity:
 
 
 # Page Views
-@dataclass
+@dataclass(slots=True, eq=False)
 class PageViews:
     shortTermTrend: str | None = None
     midTermTrend: str | None = None
@@ -461,7 +461,7 @@ class PageViews:
 
 
 # Price
-@dataclass
+@dataclass(slots=True, eq=False, kw_only=True)
 class Price:
     currency: str | None = None
     currencySymbol: str | None = None
@@ -499,7 +499,7 @@ class Price:
 
 
 # Quote Type
-@dataclass
+@dataclass(slots=True, eq=False)
 class QuoteType:
     exchange: str | None = None
     firstTradeDateEpochUtc: datetime | None = None
@@ -517,7 +517,7 @@ class QuoteType:
 
 
 # Quotes
-@dataclass
+@dataclass(slots=True, eq=False, kw_only=True)
 class Quotes:
     ask: float = 0.0
     askSize: int = 0
@@ -603,7 +603,7 @@ class Quotes:
 
 
 # Recommendation Trend
-@dataclass
+@dataclass(slots=True, eq=False)
 class RecommendationTrendItem:
     buy: int = 0
     hold: int = 0
@@ -613,21 +613,21 @@ class RecommendationTrendItem:
     strongSell: int = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class RecommendationTrend:
     trend: list[RecommendationTrendItem] = field(default_factory=list)
     maxAge: int = 0
 
 
 # SEC Filings
-@dataclass
+@dataclass(slots=True, eq=False)
 class SecFilingExhibit:
     downloadUrl: str | None = None
     type: str | None = None
     url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SecFiling:
     date: datetime | None = None
     edgarUrl: str | None = None
@@ -638,7 +638,7 @@ class SecFiling:
     type: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SecFilings:
     filings: list[SecFiling] = field(default_factory=list)
     maxAge: int = 0
@@ -649,7 +649,7 @@ class SecFilings:
 
 
 # Summary Detail
-@dataclass
+@dataclass(slots=True, eq=False, kw_only=True)
 class SummaryDetail:
     algorithm: str | None = None
     allTimeHigh: float = 0.0
@@ -697,7 +697,7 @@ class SummaryDetail:
 
 
 # Summary Profile
-@dataclass
+@dataclass(slots=True, eq=False)
 class SummaryProfile:
     address1: str | None = None
     city: str | None = None
@@ -721,7 +721,7 @@ class SummaryProfile:
 
 
 # Technical Insights
-@dataclass
+@dataclass(slots=True, eq=False)
 class CompanySnapshotCompany:
     dividends: float = 0.0
     earningsReports: float = 0.0
@@ -731,7 +731,7 @@ class CompanySnapshotCompany:
     sustainability: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class CompanySnapshotSector:
     dividends: float = 0.0
     earningsReports: float = 0.0
@@ -741,14 +741,14 @@ class CompanySnapshotSector:
     sustainability: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class CompanySnapshot:
     company: CompanySnapshotCompany = field(default_factory=CompanySnapshotCompany)
     sector: CompanySnapshotSector = field(default_factory=CompanySnapshotSector)
     sectorInfo: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class KeyTechnicals:
     provider: str | None = None
     resistance: float = 0.0
@@ -756,7 +756,7 @@ class KeyTechnicals:
     support: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class TechnicalEventOutlook:
     direction: str | None = None
     indexDirection: str | None = None
@@ -770,7 +770,7 @@ class TechnicalEventOutlook:
     stateDescription: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class TechnicalEvents:
     intermediateTermOutlook: TechnicalEventOutlook = field(
         default_factory=TechnicalEventOutlook
@@ -785,7 +785,7 @@ class TechnicalEvents:
     )
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Valuation:
     color: float = 0.0
     discount: str | None = None
@@ -793,21 +793,21 @@ class Valuation:
     relativeValue: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class InstrumentInfo:
     keyTechnicals: KeyTechnicals = field(default_factory=KeyTechnicals)
     technicalEvents: TechnicalEvents = field(default_factory=TechnicalEvents)
     valuation: Valuation = field(default_factory=Valuation)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Recommendation:
     provider: str | None = None
     rating: str | None = None
     targetPrice: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SecReport:
     description: str | None = None
     filingDate: int = 0
@@ -818,7 +818,7 @@ class SecReport:
     type: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class TechnicalInsights:
     companySnapshot: CompanySnapshot = field(default_factory=CompanySnapshot)
     instrumentInfo: InstrumentInfo = field(default_factory=InstrumentInfo)
@@ -826,7 +826,7 @@ class TechnicalInsights:
     secReports: list[SecReport] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class UpgradeDowngradeHistoryItem:
     epochGradeDate: datetime | None = None
     firm: str | None = None
@@ -838,66 +838,46 @@ class UpgradeDowngradeHistoryItem:
     priorPriceTarget: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class UpgradeDowngradeHistory:
     history: list[UpgradeDowngradeHistoryItem] = field(default_factory=list)
     maxAge: int = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class AllModules:
     assetProfile: AssetProfile = field(default_factory=AssetProfile)
-    balanceSheetHistory: BalanceSheetHistory = field(
-        default_factory=BalanceSheetHistory
-    )
-    balanceSheetHistoryQuarterly: BalanceSheetHistoryQuarterly = field(
-        default_factory=BalanceSheetHistoryQuarterly
-    )
-    calendarEvents: CalendarEvents = field(default_factory=CalendarEvents)
-    cashflowStatementHistory: CashFlowStatementHistory = field(
-        default_factory=CashFlowStatementHistory
-    )
-    cashFlowStatementHistoryQuarterly: CashFlowStatementHistoryQuarterly = field(
-        default_factory=CashFlowStatementHistoryQuarterly
-    )
+    balanceSheetHistory: BalanceSheetHistory | None = None
+    balanceSheetHistoryQuarterly: BalanceSheetHistoryQuarterly | None = None
+    calendarEvents: CalendarEvents | None = None
+    cashflowStatementHistory: CashFlowStatementHistory | None = None
+    cashFlowStatementHistoryQuarterly: CashFlowStatementHistoryQuarterly | None = None
     defaultKeyStatistics: DefaultKeyStatistics = field(
         default_factory=DefaultKeyStatistics
     )
-    earnings: Earnings = field(default_factory=Earnings)
-    earningsHistory: EarningsHistory = field(default_factory=EarningsHistory)
-    earningsTrend: EarningsTrend = field(default_factory=EarningsTrend)
+    earnings: Earnings | None = None
+    earningsHistory: EarningsHistory | None = None
+    earningsTrend: EarningsTrend | None = None
     financialData: FinancialData = field(default_factory=FinancialData)
-    fundOwnership: FundOwnership = field(default_factory=FundOwnership)
-    indexTrend: IndexTrend = field(default_factory=IndexTrend)
-    industryTrend: IndustryTrend = field(default_factory=IndustryTrend)
-    insiderHolders: InsiderHolders = field(default_factory=InsiderHolders)
-    insiderTransactions: InsiderTransactions = field(
-        default_factory=InsiderTransactions
-    )
-    institutionOwnership: InstitutionOwnership = field(
-        default_factory=InstitutionOwnership
-    )
-    majorHoldersBreakdown: MajorHoldersBreakdown = field(
-        default_factory=MajorHoldersBreakdown
-    )
-    netSharePurchaseActivity: NetSharePurchaseActivity = field(
-        default_factory=NetSharePurchaseActivity
-    )
-    pageViews: PageViews = field(default_factory=PageViews)
-    quoteType: QuoteType = field(default_factory=QuoteType)
+    fundOwnership: FundOwnership | None = None
+    indexTrend: IndexTrend | None = None
+    industryTrend: IndustryTrend | None = None
+    insiderHolders: InsiderHolders | None = None
+    insiderTransactions: InsiderTransactions | None = None
+    institutionOwnership: InstitutionOwnership | None = None
+    majorHoldersBreakdown: MajorHoldersBreakdown | None = None
+    netSharePurchaseActivity: NetSharePurchaseActivity | None = None
+    pageViews: PageViews | None = None
+    quoteType: QuoteType | None = None
     price: Price = field(default_factory=Price)
-    recommendationTrend: RecommendationTrend = field(
-        default_factory=RecommendationTrend
-    )
-    secFilings: SecFilings = field(default_factory=SecFilings)
+    recommendationTrend: RecommendationTrend | None = None
+    secFilings: SecFilings | None = None
     summaryDetail: SummaryDetail = field(default_factory=SummaryDetail)
     summaryProfile: SummaryProfile = field(default_factory=SummaryProfile)
-    upgradeDowngradeHistory: UpgradeDowngradeHistory = field(
-        default_factory=UpgradeDowngradeHistory
-    )
+    upgradeDowngradeHistory: UpgradeDowngradeHistory | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class QuoteData:
     symbol: str = ""
     current: float = 0.0
@@ -906,53 +886,33 @@ class QuoteData:
     change_pct: str = ""
     currency_symbol: str = ""
     assetProfile: AssetProfile = field(default_factory=AssetProfile)
-    balanceSheetHistory: BalanceSheetHistory = field(
-        default_factory=BalanceSheetHistory
-    )
-    balanceSheetHistoryQuarterly: BalanceSheetHistoryQuarterly = field(
-        default_factory=BalanceSheetHistoryQuarterly
-    )
-    calendarEvents: CalendarEvents = field(default_factory=CalendarEvents)
-    cashflowStatementHistory: CashFlowStatementHistory = field(
-        default_factory=CashFlowStatementHistory
-    )
-    cashFlowStatementHistoryQuarterly: CashFlowStatementHistoryQuarterly = field(
-        default_factory=CashFlowStatementHistoryQuarterly
-    )
+    balanceSheetHistory: BalanceSheetHistory | None = None
+    balanceSheetHistoryQuarterly: BalanceSheetHistoryQuarterly | None = None
+    calendarEvents: CalendarEvents | None = None
+    cashflowStatementHistory: CashFlowStatementHistory | None = None
+    cashFlowStatementHistoryQuarterly: CashFlowStatementHistoryQuarterly | None = None
     defaultKeyStatistics: DefaultKeyStatistics = field(
         default_factory=DefaultKeyStatistics
     )
-    earnings: Earnings = field(default_factory=Earnings)
-    earningsHistory: EarningsHistory = field(default_factory=EarningsHistory)
-    earningsTrend: EarningsTrend = field(default_factory=EarningsTrend)
+    earnings: Earnings | None = None
+    earningsHistory: EarningsHistory | None = None
+    earningsTrend: EarningsTrend | None = None
     financialData: FinancialData = field(default_factory=FinancialData)
-    fundOwnership: FundOwnership = field(default_factory=FundOwnership)
-    indexTrend: IndexTrend = field(default_factory=IndexTrend)
-    industryTrend: IndustryTrend = field(default_factory=IndustryTrend)
-    insiderHolders: InsiderHolders = field(default_factory=InsiderHolders)
-    insiderTransactions: InsiderTransactions = field(
-        default_factory=InsiderTransactions
-    )
-    institutionOwnership: InstitutionOwnership = field(
-        default_factory=InstitutionOwnership
-    )
-    majorHoldersBreakdown: MajorHoldersBreakdown = field(
-        default_factory=MajorHoldersBreakdown
-    )
-    netSharePurchaseActivity: NetSharePurchaseActivity = field(
-        default_factory=NetSharePurchaseActivity
-    )
-    pageViews: PageViews = field(default_factory=PageViews)
-    quoteType: QuoteType = field(default_factory=QuoteType)
+    fundOwnership: FundOwnership | None = None
+    indexTrend: IndexTrend | None = None
+    industryTrend: IndustryTrend | None = None
+    insiderHolders: InsiderHolders | None = None
+    insiderTransactions: InsiderTransactions | None = None
+    institutionOwnership: InstitutionOwnership | None = None
+    majorHoldersBreakdown: MajorHoldersBreakdown | None = None
+    netSharePurchaseActivity: NetSharePurchaseActivity | None = None
+    pageViews: PageViews | None = None
+    quoteType: QuoteType | None = None
     quotes: Quotes = field(default_factory=Quotes)
     price: Price = field(default_factory=Price)
-    recommendationTrend: RecommendationTrend = field(
-        default_factory=RecommendationTrend
-    )
-    secFilings: SecFilings = field(default_factory=SecFilings)
+    recommendationTrend: RecommendationTrend | None = None
+    secFilings: SecFilings | None = None
     summaryDetail: SummaryDetail = field(default_factory=SummaryDetail)
     summaryProfile: SummaryProfile = field(default_factory=SummaryProfile)
-    technicalInsights: TechnicalInsights = field(default_factory=TechnicalInsights)
-    upgradeDowngradeHistory: UpgradeDowngradeHistory = field(
-        default_factory=UpgradeDowngradeHistory
-    )
+    technicalInsights: TechnicalInsights | None = None
+    upgradeDowngradeHistory: UpgradeDowngradeHistory | None = None
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherLocation:
     country: str = ""
     lat: str = ""
@@ -14,14 +14,14 @@ class WeatherLocation:
 
 
 # Condition
-@dataclass
+@dataclass(slots=True)
 class WeatherCondition:
     code: int = 0
     icon: str | None = None
     text: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherCurrent:
     cloud: int = 0
     condition: WeatherCondition = field(default_factory=WeatherCondition)
@@ -55,7 +55,7 @@ class WeatherCurrent:
 
 
 # Forecast
-@dataclass
+@dataclass(slots=True)
 class WeatherAstro:
     in_sun_up: bool = False
     is_moon_up: bool = False
@@ -71,7 +71,7 @@ class WeatherAstro:
     sunset_unix: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherDay:
     avghumidity: int = 0
     avgtemp_c: float = 0.0
@@ -96,66 +96,27 @@ class WeatherDay:
     uv: float = 0.0
 
 
-@dataclass
-class WeatherForecastHour:
-    chance_of_rain: int = 0
-    chance_of_snow: int = 0
-    cloud: int = 0
-    condition: WeatherCondition = field(default_factory=WeatherCondition)
-    dewpoint_c: float = 0.0
-    dewpoint_f: float = 0.0
-    feelslike_c: float = 0.0
-    feelslike_f: float = 0.0
-    gust_kph: float = 0.0
-    gust_mph: float = 0.0
-    heatindex_c: float = 0.0
-    heatindex_f: float = 0.0
-    humidity: int = 0
-    is_day: int = 0
-    precip_in: float = 0.0
-    precip_mm: float = 0.0
-    pressure_in: float = 0.0
-    pressure_mb: float = 0.0
-    snow_cm: float = 0.0
-    temp_c: float = 0.0
-    temp_f: float = 0.0
-    time_epoch: int = 0
-    timestamp: str | None = None
-    uv: int = 0
-    vis_km: float = 0.0
-    vis_miles: float = 0.0
-    will_it_rain: int = 0
-    will_it_snow: int = 0
-    wind_degree: int = 0
-    wind_dir: str | None = None
-    wind_kph: float = 0.0
-    wind_mph: float = 0.0
-    windchill_c: float = 0.0
-    windchill_f: float = 0.0
-
-
-@dataclass
+@dataclass(slots=True)
 class WeatherForecastDay:
     astro: WeatherAstro = field(default_factory=WeatherAstro)
     date: str | None = None
     date_epoch: int = 0
     day: WeatherDay = field(default_factory=WeatherDay)
-    hour: list[WeatherForecastHour] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherForecast:
     forecastday: list[WeatherForecastDay] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherData:
     location: WeatherLocation = field(default_factory=WeatherLocation)
     current: WeatherCurrent = field(default_factory=WeatherCurrent)
     forecast: WeatherForecast = field(default_factory=WeatherForecast)
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationData:
     success: bool = False
     error: str | None = None
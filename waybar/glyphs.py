@@ -1,158 +1,154 @@
-def surrogatepass(code: str) -> str:
-    return code.encode("utf-16", "surrogatepass").decode("utf-16")
-
-
 # Weather
-fa_sun = surrogatepass("")
-fa_sun_o = surrogatepass("\uf185")
-fa_wind = surrogatepass("\uef16")
-md_weather_cloudy = surrogatepass("\udb81\udd90")
-md_weather_fog = surrogatepass("\udb81\udd91")
-md_weather_hazy = surrogatepass("\udb83\udf30")
-md_weather_night = surrogatepass("\udb81\udd94")
-md_weather_night_partly_cloudy = surrogatepass("\udb83\udf31")
-md_weather_partly_cloudy = surrogatepass("\udb81\udd95")
-md_weather_partly_rainy = surrogatepass("\udb83\udf33")
-md_weather_partly_snowy = surrogatepass("\udb83\udf34")
-md_weather_partly_snowy_rainy = surrogatepass("\udb83\udf35")
-md_weather_snowy = surrogatepass("\udb81\udd98")
-md_weather_snowy_heavy = surrogatepass("\udb83\udf36")
-md_weather_snowy_rainy = surrogatepass("\udb81\ude7f")
-md_weather_sunny = surrogatepass("\uf185")
-md_weather_sunset_down = surrogatepass("\udb81\udd9b")
-md_white_balance_sunny = surrogatepass("\udb81\udda8")
-oct_sun = surrogatepass("\uf522")
-weather_day_cloudy = surrogatepass("\ue302")
-weather_day_rain = surrogatepass("\ue308")
-weather_day_showers = surrogatepass("\ue309")
-weather_day_sleet = surrogatepass("\ue3aa")
-weather_day_sleet_storm = surrogatepass("\ue362")
-weather_day_snow = surrogatepass("\ue30a")
-weather_day_snow_thunderstorm = surrogatepass("\ue365")
-weather_day_snow_wind = surrogatepass("\ue35f")
-weather_day_storm_showers = surrogatepass("\ue30e")
-weather_day_sunny = surrogatepass("\ue30d")
-weather_day_sunny_overcast = surrogatepass("\ue30c")
-weather_day_thunderstorm = surrogatepass("\ue30f")
-weather_moonrise = surrogatepass("\ue3c1")
-weather_moonset = surrogatepass("\ue3c2")
-weather_night_alt_sleet = surrogatepass("\ue3ac")
-weather_night_alt_sleet_storm = surrogatepass("\ue364")
-weather_night_alt_snow = surrogatepass("\ue327")
-weather_night_alt_snow_thunderstorm = surrogatepass("\ue367")
-weather_night_alt_snow_wind = surrogatepass("\ue361")
-weather_night_cloudy = surrogatepass("\ue32e")
-weather_night_rain = surrogatepass("\ue333")
-weather_night_showers = surrogatepass("\ue334")
-weather_night_sleet = surrogatepass("\ue3ab")
-weather_night_sleet_storm = surrogatepass("\ue363")
-weather_night_snow = surrogatepass("\ue335")
-weather_night_snow_thunderstorm = surrogatepass("\ue366")
-weather_night_snow_wind = surrogatepass("\ue360")
-weather_night_storm_showers = surrogatepass("\ue337")
-weather_night_thunderstorm = surrogatepass("\ue338")
-weather_rain = surrogatepass("\ue318")
-weather_rain_mix = surrogatepass("\ue316")
-weather_sleet = surrogatepass("\ue3ad")
-weather_snow_wind = surrogatepass("\ue35e")
-weather_sunrise = surrogatepass("\ue34c")
-weather_sunset = surrogatepass("\ue34d")
+fa_sun = "\uf185"
+fa_sun_o = "\uf185"
+fa_wind = "\uef16"
+md_weather_cloudy = "\U000f0590"
+md_weather_fog = "\U000f0591"
+md_weather_hazy = "\U000f0f30"
+md_weather_night = "\U000f0594"
+md_weather_night_partly_cloudy = "\U000f0f31"
+md_weather_partly_cloudy = "\U000f0595"
+md_weather_partly_rainy = "\U000f0f33"
+md_weather_partly_snowy = "\U000f0f34"
+md_weather_partly_snowy_rainy = "\U000f0f35"
+md_weather_snowy = "\U000f0598"
+md_weather_snowy_heavy = "\U000f0f36"
+md_weather_snowy_rainy = "\U000f067f"
+md_weather_sunny = "\uf185"
+md_weather_sunset_down = "\U000f059b"
+md_white_balance_sunny = "\U000f05a8"
+oct_sun = "\uf522"
+weather_day_cloudy = "\ue302"
+weather_day_rain = "\ue308"
+weather_day_showers = "\ue309"
+weather_day_sleet = "\ue3aa"
+weather_day_sleet_storm = "\ue362"
+weather_day_snow = "\ue30a"
+weather_day_snow_thunderstorm = "\ue365"
+weather_day_snow_wind = "\ue35f"
+weather_day_storm_showers = "\ue30e"
+weather_day_sunny = "\ue30d"
+weather_day_sunny_overcast = "\ue30c"
+weather_day_thunderstorm = "\ue30f"
+weather_moonrise = "\ue3c1"
+weather_moonset = "\ue3c2"
+weather_night_alt_sleet = "\ue3ac"
+weather_night_alt_sleet_storm = "\ue364"
+weather_night_alt_snow = "\ue327"
+weather_night_alt_snow_thunderstorm = "\ue367"
+weather_night_alt_snow_wind = "\ue361"
+weather_night_cloudy = "\ue32e"
+weather_night_rain = "\ue333"
+weather_night_showers = "\ue334"
+weather_night_sleet = "\ue3ab"
+weather_night_sleet_storm = "\ue363"
+weather_night_snow = "\ue335"
+weather_night_snow_thunderstorm = "\ue366"
+weather_night_snow_wind = "\ue360"
+weather_night_storm_showers = "\ue337"
+weather_night_thunderstorm = "\ue338"
+weather_rain = "\ue318"
+weather_rain_mix = "\ue316"
+weather_sleet = "\ue3ad"
+weather_snow_wind = "\ue35e"
+weather_sunrise = "\ue34c"
+weather_sunset = "\ue34d"
 
 # WiFi
-md_wifi_strength_1 = surrogatepass("\udb82\udd1f")
-md_wifi_strength_1_alert = surrogatepass("\udb82\udd20")
-md_wifi_strength_1_lock = surrogatepass("\udb82\udd21")
-md_wifi_strength_1_lock_open = surrogatepass("\udb85\udecb")
-md_wifi_strength_2 = surrogatepass("\udb82\udd22")
-md_wifi_strength_2_alert = surrogatepass("\udb82\udd23")
-md_wifi_strength_2_lock = surrogatepass("\udb82\udd24")
-md_wifi_strength_2_lock_open = surrogatepass("\udb85\udecc")
-md_wifi_strength_3 = surrogatepass("\udb82\udd25")
-md_wifi_strength_3_alert = surrogatepass("\udb82\udd26")
-md_wifi_strength_3_lock = surrogatepass("\udb82\udd27")
-md_wifi_strength_3_lock_open = surrogatepass("\udb85\udecd")
-md_wifi_strength_4 = surrogatepass("\udb82\udd28")
-md_wifi_strength_4_alert = surrogatepass("\udb82\udd29")
-md_wifi_strength_4_lock = surrogatepass("\udb82\udd2a")
-md_wifi_strength_4_lock_open = surrogatepass("\udb85\udece")
-md_wifi_strength_alert_outline = surrogatepass("\udb82\udd2b")
-md_wifi_strength_lock_open_outline = surrogatepass("\udb85\udecf")
-md_wifi_strength_lock_outline = surrogatepass("\udb82\udd2c")
-md_wifi_strength_off = surrogatepass("\udb82\udd2d")
-md_wifi_strength_off_outline = surrogatepass("\udb82\udd2e")
-md_wifi_strength_outline = surrogatepass("\udb82\udd2f")
+md_wifi_strength_1 = "\U000f091f"
+md_wifi_strength_1_alert = "\U000f0920"
+md_wifi_strength_1_lock = "\U000f0921"
+md_wifi_strength_1_lock_open = "\U000f16cb"
+md_wifi_strength_2 = "\U000f0922"
+md_wifi_strength_2_alert = "\U000f0923"
+md_wifi_strength_2_lock = "\U000f0924"
+md_wifi_strength_2_lock_open = "\U000f16cc"
+md_wifi_strength_3 = "\U000f0925"
+md_wifi_strength_3_alert = "\U000f0926"
+md_wifi_strength_3_lock = "\U000f0927"
+md_wifi_strength_3_lock_open = "\U000f16cd"
+md_wifi_strength_4 = "\U000f0928"
+md_wifi_strength_4_alert = "\U000f0929"
+md_wifi_strength_4_lock = "\U000f092a"
+md_wifi_strength_4_lock_open = "\U000f16ce"
+md_wifi_strength_alert_outline = "\U000f092b"
+md_wifi_strength_lock_open_outline = "\U000f16cf"
+md_wifi_strength_lock_outline = "\U000f092c"
+md_wifi_strength_off = "\U000f092d"
+md_wifi_strength_off_outline = "\U000f092e"
+md_wifi_strength_outline = "\U000f092f"
 
 # Weather
-cod_arrow_small_down = surrogatepass("\uea9d")
-cod_arrow_small_up = arrow_up = surrogatepass("\ueaa0")
-cod_graph_line = surrogatepass("\uebe2")
+cod_arrow_small_down = "\uea9d"
+cod_arrow_small_up = arrow_up = "\ueaa0"
+cod_graph_line = "\uebe2"
 
 # CPU
-oct_cpu = surrogatepass("\uf4bc")
-md_cpu_32_bit = surrogatepass("\udb83\udedf")
-md_cpu_64_bit = surrogatepass("\udb83\udee0")
+oct_cpu = "\uf4bc"
+md_cpu_32_bit = "\U000f0edf"
+md_cpu_64_bit = "\U000f0ee0"
 
 # Disk
-md_harddisk = surrogatepass("\udb80\udeca")
+md_harddisk = "\U000f02ca"
 
 # Memory
-cod_arrow_swap = surrogatepass("\uebcb")
-fa_memory = surrogatepass("\uefc5")
-md_memory = surrogatepass("\udb80\udf5b")
+cod_arrow_swap = "\uebcb"
+fa_memory = "\uefc5"
+md_memory = "\U000f035b"
 
 # Speedtest
-md_speedometer_slow = surrogatepass("\udb83\udf86")
-md_speedometer_medium = surrogatepass("\udb83\udf85")
-md_speedometer_fast = surrogatepass("\udb81\udcc5")
+md_speedometer_slow = "\U000f0f86"
+md_speedometer_medium = "\U000f0f85"
+md_speedometer_fast = "\U000f04c5"
 
 # Others
-cod_package = surrogatepass("\ueb29")
-dev_dropbox = surrogatepass("\ue707")
-fa_arrow_rotate_right = surrogatepass("\uf01e")
-fa_bolt = surrogatepass("\uf0e7")
-fa_dropbox = surrogatepass("\uf16b")
-fa_skull = surrogatepass("\uee15")
-fa_skull_crossbones = surrogatepass("\uef0e")
-md_check = surrogatepass("\udb80\udd2c")
-md_dropbox = surrogatepass("\udb80\udde3")
-md_file = surrogatepass("\udb80\ude14")
-md_folder = surrogatepass("\udb80\ude4b")
-md_package_variant = surrogatepass("\udb80\udfd6")
-md_skull = surrogatepass("\udb81\ude8c")
-md_skull_crossbones = surrogatepass("\udb82\udfc6")
-md_timer_outline = surrogatepass("\udb81\udd1b")
-oct_circle_dash = surrogatepass("\uf468")
+cod_package = "\ueb29"
+dev_dropbox = "\ue707"
+fa_arrow_rotate_right = "\uf01e"
+fa_bolt = "\uf0e7"
+fa_dropbox = "\uf16b"
+fa_skull = "\uee15"
+fa_skull_crossbones = "\uef0e"
+md_check = "\U000f012c"
+md_dropbox = "\U000f01e3"
+md_file = "\U000f0214"
+md_folder = "\U000f024b"
+md_package_variant = "\U000f03d6"
+md_skull = "\U000f068c"
+md_skull_crossbones = "\U000f0bc6"
+md_timer_outline = "\U000f051b"
+oct_circle_dash = "\uf468"
 icon_spacer = "  "
 
 # Alerts
-md_alert = surrogatepass("\udb80\udc26")
-md_network_off = surrogatepass("\udb83\udc9b")
-md_network_off_outline = surrogatepass("\udb83\udc9c")
-oct_alert = surrogatepass("\uf421")
+md_alert = "\U000f0026"
+md_network_off = "\U000f0c9b"
+md_network_off_outline = "\U000f0c9c"
+oct_alert = "\uf421"
 
 # Network
-md_network = surrogatepass("\udb81\udef3")
+md_network = "\U000f06f3"
 
 # Plex
-md_plex = surrogatepass("\udb81\udeba")
+md_plex = "\U000f06ba"
 
 # Software updates
-linux_alpine = surrogatepass("\uf300")
-linux_centos = surrogatepass("\uf304")
-linux_flathub = surrogatepass("\uf324")
-linux_kali_linux = surrogatepass("\uf327")
-linux_kubuntu = surrogatepass("\uf333")
-linux_opensuse = surrogatepass("\uf314")
-linux_slackware = surrogatepass("\uf318")
-linux_ubuntu = surrogatepass("\uf31b")
-linux_void = surrogatepass("\uf32e")
-md_arch = surrogatepass("\udb82\udcc7")
-md_debian = surrogatepass("\udb82\udcda")
-md_fedora = surrogatepass("\udb82\udcdb")
-md_gentoo = surrogatepass("\udb82\udce8")
-md_linux = surrogatepass("\udb80\udf3d")
-md_linux_mint = surrogatepass("\udb82\udced")
-md_redhat = surrogatepass("\udb84\udd1b")
+linux_alpine = "\uf300"
+linux_centos = "\uf304"
+linux_flathub = "\uf324"
+linux_kali_linux = "\uf327"
+linux_kubuntu = "\uf333"
+linux_opensuse = "\uf314"
+linux_slackware = "\uf318"
+linux_ubuntu = "\uf31b"
+linux_void = "\uf32e"
+md_arch = "\U000f08c7"
+md_debian = "\U000f08da"
+md_fedora = "\U000f08db"
+md_gentoo = "\U000f08e8"
+md_linux = "\U000f033d"
+md_linux_mint = "\U000f08ed"
+md_redhat = "\U000f111b"
 
 distro_map: dict[str, str] = {
     "alpine": linux_alpine,
@@ -1,4 +1,3 @@
-import json
 import time
 import urllib.error
 import urllib.parse
@@ -8,12 +7,14 @@ from dataclasses import dataclass, field
 from http.client import HTTPResponse
 from typing import cast
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class Response:
     status: int = 0
     headers: dict[str, object] = field(default_factory=dict)
-    body: str | None = None
+    body: object | None = None
 
 
 def request(
@@ -54,7 +55,7 @@ def request(
 
     if data:
         if isinstance(data, dict):
-            json_data = json.dumps(data).encode("utf-8")
+            json_data = orjson.dumps(data)
             headers = headers or {}
             headers["Content-Type"] = "application/json"
 
@@ -71,7 +72,11 @@ def request(
 
             with urllib.request.urlopen(request, timeout=timeout) as resp_any:
                 response = cast(HTTPResponse, resp_any)
-                body = response.read().decode("utf-8").strip()
+                raw_body = response.read()
+                try:
+                    body: object = orjson.loads(raw_body)
+                except orjson.JSONDecodeError:
+                    body = raw_body.decode("utf-8").strip()
 
                 return Response(
                     status=response.status,
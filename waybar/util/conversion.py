@@ -1,5 +1,27 @@
-import re
-from typing import cast
+import math
+from functools import lru_cache
+
+binary_prefixes = ("", "Ki", "Mi", "Gi", "Ti", "Pi", "Ei", "Zi", "Yi")
+decimal_prefixes = ("", "K", "M", "G", "T")
+lower_or_digit = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+unit_divisors: dict[str, int] = {
+    "K": 1000,
+    "Ki": 1024,
+    "M": 1000**2,
+    "Mi": 1024**2,
+    "G": 1000**3,
+    "Gi": 1024**3,
+    "T": 1000**4,
+    "Ti": 1024**4,
+    "P": 1000**5,
+    "Pi": 1024**5,
+    "E": 1000**6,
+    "Ei": 1024**6,
+    "Z": 1000**7,
+    "Zi": 1024**7,
+    "Y": 1000**8,
+    "Yi": 1024**8,
+}
 
 
 def valid_storage_units() -> list[str]:
@@ -35,6 +57,15 @@ def pad_float(number: float = 0.0, round_int: bool = False) -> str:
         return f"{number:.2f}"
 
 
+def binary_index(number: float) -> int:
+    """
+    Return the index into binary_prefixes for the given number of bytes.
+    """
+    # frexp returns the binary exponent, so each 1024 step is 10 of it
+    _, exponent = math.frexp(number)
+    return min(max((exponent - 1) // 10, 0), len(binary_prefixes) - 1)
+
+
 def byte_converter(number: float, unit: str = "auto", use_int: bool = False) -> str:
     """
     Convert bytes to the given unit.
@@ -44,44 +75,17 @@ def byte_converter(number: float, unit: str = "auto", use_int: bool = False) ->
     suffix = "B"
 
     if unit == "auto":
-        for unit_prefix in ["", "Ki", "Mi", "Gi", "Ti", "Pi", "Ei", "Zi", "Yi"]:
-            if abs(number) < 1024.0:
-                return (
-                    f"{pad_float(number=number, round_int=False)} {unit_prefix}{suffix}"
-                )
-            number /= 1024
-        return f"{pad_float(number=number, round_int=False)} Yi{suffix}"
+        index = binary_index(number)
+        number = number / (1 << (10 * index))
+        return f"{number:.2f} {binary_prefixes[index]}{suffix}"
     else:
-        divisor: int = 1000
-        if len(unit) == 2 and unit.endswith("i"):
-            divisor = 1024
-
-        prefix_map: dict[str, int] = {
-            "K": 1,
-            "Ki": 1,
-            "M": 2,
-            "Mi": 2,
-            "G": 3,
-            "Gi": 3,
-            "T": 4,
-            "Ti": 4,
-            "P": 5,
-            "Pi": 5,
-            "E": 6,
-            "Ei": 6,
-            "Z": 7,
-            "Zi": 7,
-            "Y": 8,
-            "Yi": 8,
-        }
-
-        if unit in prefix_map:
-            power: int = prefix_map[unit]
-            value = cast(float, number / (divisor**power))
+        divisor = unit_divisors.get(unit)
+        if divisor:
+            value = number / divisor
             if use_int:
                 return f"{int(value)} {unit}{suffix}"
             else:
-                return f"{pad_float(value, round_int=False)} {unit}{suffix}"
+                return f"{value:.2f} {unit}{suffix}"
         else:
             return f"{number} {suffix}"
 
@@ -91,11 +95,9 @@ def process_bytes(num: float) -> str:
     Process the rate of data, e.g., MiB/s.
     """
     suffix = "B"
-    for unit in ["", "Ki", "Mi", "Gi", "Ti", "Pi", "Ei", "Zi"]:
-        if abs(num) < 1024.0:
-            return f"{pad_float(num, round_int=False)} {unit}{suffix}/s"
-        num = num / 1024
-    return f"{pad_float(number=num, round_int=False)} Yi{suffix}"
+    index = binary_index(num)
+    num = num / (1 << (10 * index))
+    return f"{num:.2f} {binary_prefixes[index]}{suffix}/s"
 
 
 def mhz_to_hz(number: float) -> float:
@@ -110,10 +112,12 @@ def processor_speed(number: float) -> str | None:
     number = mhz_to_hz(number=number)
     suffix = "Hz"
 
-    for unit in ["", "K", "M", "G", "T"]:
-        if abs(number) < 1000.0:
-            return f"{pad_float(number=number, round_int=False)} {unit}{suffix}"
-        number = number / 1000
+    # Every three integer digits is another power of 1000
+    index = (len(str(int(abs(number)))) - 1) // 3
+    if index >= len(decimal_prefixes):
+        return None
+    number = number / (1000**index)
+    return f"{number:.2f} {decimal_prefixes[index]}{suffix}"
 
 
 def float_to_pct(number: float = 0) -> str:
@@ -123,21 +127,30 @@ def float_to_pct(number: float = 0) -> str:
     return f"{number:.2f}%"
 
 
+@lru_cache(maxsize=1024)
 def to_snake_case(name: str) -> str:
-    # Strip quotes
-    name = re.sub(r"\"", "", name.strip())
-
-    # Trim and replace spaces (and multiple spaces) with underscores
-    name = re.sub(r"\s+", "_", name.strip())
-
-    # Trim and replace hyphens with underscores
-    name = re.sub(r"-+", "_", name.strip())
-
-    # Handle CamelCase / PascalCase properly (keeps acronyms intact)
-    name = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name)
-    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
-
-    return name.lower()
+    """
+    Convert a name to snake_case in a single pass. Quotes are dropped, runs of
+    whitespace and runs of hyphens each become one underscore, and an
+    underscore goes before an uppercase letter that follows a lowercase letter
+    or digit, or that starts a capitalized word (so acronyms stay together).
+    """
+    name = name.strip().replace('"', "").strip()
+    out: list[str] = []
+    prev = ""
+    for idx, char in enumerate(name):
+        if char.isspace() or char == "-":
+            if not (prev == "-" if char == "-" else prev.isspace()):
+                out.append("_")
+        else:
+            if "A" <= char <= "Z" and out:
+                after = name[idx + 1 : idx + 2]
+                if "a" <= after <= "z" or out[-1] in lower_or_digit:
+                    out.append("_")
+            out.append(char)
+        prev = char
+
+    return "".join(out).lower()
 
 
 def km_to_m(number: float) -> str:
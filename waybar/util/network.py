@@ -1,16 +1,26 @@
-import json
 import os
-import re
 import socket
+import time
 from dataclasses import dataclass, field
-from typing import cast
+from typing import Any, cast
 
+import orjson
 from dacite import Config, from_dict
+
 from waybar import glyphs, http
 from waybar.util import conversion, system
 
+dacite_config = Config(cast=[str])
+interface_cache: dict[str, tuple[float, bool]] = {}
+interface_ttl = 2
+last_reachable: float = 0.0
+location_cache: dict[str, tuple[float, "LocationData"]] = {}
+lookup_ttl = 300
+public_ip_cache: tuple[float, str] | None = None
+reachable_ttl = 30
+
 
-@dataclass
+@dataclass(slots=True)
 class LocationData:
     city: str | None = None
     country: str | None = None
@@ -24,7 +34,7 @@ class LocationData:
     timezone: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Interface:
     Connected: bool = False
     Device: str = ""
@@ -43,21 +53,23 @@ def _find_all_network_interfaces() -> list[str]:
     """
     Find and return a list of all interfaces using /sys/class/net.
     """
-    network_interfaces: list[str] = []
-    rc, stdout_raw, _ = system.run_piped_command("ls -1 /sys/class/net")
-
-    stdout = stdout_raw if isinstance(stdout_raw, str) else ""
-    if rc == 0:
-        network_interfaces = [x for x in re.split(r"\n", stdout)]
-
-    return sorted(network_interfaces)
+    try:
+        return sorted(os.listdir("/sys/class/net"))
+    except OSError:
+        return []
 
 
 def _interface_exists(interface: str) -> bool:
-    try:
-        return os.path.isdir(f"/sys/class/net/{interface}")
-    except Exception:
-        return False
+    # Each interface is checked several times per refresh, so keep the answer
+    # for a couple of seconds
+    now = time.monotonic()
+    cached = interface_cache.get(interface)
+    if cached and now - cached[0] < interface_ttl:
+        return cached[1]
+
+    exists = os.access(f"/sys/class/net/{interface}", os.F_OK)
+    interface_cache[interface] = (now, exists)
+    return exists
 
 
 def _interface_type(interface: str) -> str:
@@ -72,10 +84,15 @@ def _interface_type(interface: str) -> str:
 
 def _interface_connected(interface: str) -> bool:
     if _interface_exists(interface=interface):
-        filename = f"/sys/class/net/{interface}/carrier"
-        with open(filename, "r") as fh:
-            contents = fh.read().strip()
-            return True if contents == "1" else False
+        # carrier is a single byte; reading it raises EINVAL while the link is down
+        try:
+            fd = os.open(f"/sys/class/net/{interface}/carrier", os.O_RDONLY)
+            try:
+                return os.read(fd, 2)[:1] == b"1"
+            finally:
+                os.close(fd)
+        except OSError:
+            return False
 
     return False
 
@@ -95,58 +112,62 @@ def _get_icon(port_type: str, port_connected: bool) -> str:
     return glyphs.md_network if port_connected else glyphs.md_network_off
 
 
-def _ifconfig(
-    interface: str,
-) -> tuple[list[str], str | None, str | None, str | None]:
-    command = f"ip addr show {interface}"
-    flags, mac, inet, inet6 = (
-        [],
-        None,
-        None,
-        None,
-    )
-    rc, stdout_raw, _ = system.run_piped_command(command)
+def _ifconfig() -> dict[str, tuple[list[str], str | None, str | None, str | None]]:
+    """
+    Return the flags, MAC, first IPv4 and first IPv6 address of every
+    interface, keyed by interface name, from a single `ip -json` call.
+    """
+    addresses: dict[str, tuple[list[str], str | None, str | None, str | None]] = {}
+    rc, stdout_raw, _ = system.run_piped_command("ip -json addr show")
 
     stdout = stdout_raw if isinstance(stdout_raw, str) else ""
     if rc == 0 and stdout:
-        match = re.search(
-            rf"\d+:\s+{interface}: \<([^\>]+)\>",
-            stdout,
-            re.MULTILINE,
-        )
-        if match:
-            flags = re.split(r"\s*,\s*", match.group(1))
-
-        match = re.search(r"ether\s+([a-z0-9:]+)", stdout)
-        if match:
-            mac = match.group(1)
+        for link in cast(list[dict[str, Any]], orjson.loads(stdout)):
+            addr_info = cast(list[dict[str, str]], link.get("addr_info", []))
+            inet = next(
+                (a["local"] for a in addr_info if a.get("family") == "inet"), None
+            )
+            inet6 = next(
+                (a["local"] for a in addr_info if a.get("family") == "inet6"), None
+            )
+            addresses[link["ifname"]] = (
+                link.get("flags", []),
+                link.get("address") if link.get("link_type") == "ether" else None,
+                inet,
+                inet6,
+            )
 
-        match = re.findall(r"inet\s+(\d+\.\d+\.\d+\.\d+)", stdout, re.MULTILINE)
-        if match:
-            inet = match[0]
+    return addresses
 
-        match = re.findall(r"inet6\s+([a-z0-9:]+)", stdout, re.MULTILINE)
-        if match:
-            inet6 = match[0]
 
-    return flags, mac, inet, inet6
+def get_public_ip() -> str | None:
+    """
+    Return the public IP address. A successful lookup is reused for
+    lookup_ttl seconds.
+    """
+    global public_ip_cache
 
+    if public_ip_cache and time.monotonic() - public_ip_cache[0] < lookup_ttl:
+        return public_ip_cache[1]
 
-def get_public_ip() -> str | None:
     _, stdout_raw, _ = system.run_piped_command("curl https://ifconfig.io")
 
     stdout = stdout_raw if isinstance(stdout_raw, str) else ""
-    return stdout if stdout else None
+    if stdout:
+        public_ip_cache = (time.monotonic(), stdout)
+        return stdout
+    return None
 
 
 def get_network_data() -> list[Interface]:
     interfaces: list[Interface] = []
     public_ip = get_public_ip()
     all_interfaces = _find_all_network_interfaces()
+    addresses = _ifconfig()
     for interface in all_interfaces:
         port_type = _interface_type(interface=interface)
         port_connected = _interface_connected(interface=interface)
-        flags, mac, inet, inet6 = _ifconfig(interface=interface)
+        flags, mac, inet, inet6 = addresses.get(interface, ([], None, None, None))
 
         interfaces.append(
             Interface(
@@ -178,42 +199,69 @@ def network_speed(number: float = 0.0, bytes: bool = False) -> str | None:
     """
     Intelligently determine network speed
     """
-    # test this with dummy numbers
     suffix = "iB/s" if bytes else "bit/s"
 
-    for unit in ["", "K", "M", "G", "T", "P"]:
-        if abs(number) < 1024.0:
-            if bytes:
-                return f"{conversion.pad_float(number=number / 8, round_int=False)} {unit}{suffix}"
-            return (
-                f"{conversion.pad_float(number=number, round_int=False)} {unit}{suffix}"
-            )
-        number = number / 1024
+    index = conversion.binary_index(number)
+    number = number / (1 << (10 * index))
+    if bytes:
+        number = number / 8
+
+    # The "i" of a binary prefix is already part of the bytes suffix
+    return f"{number:.2f} {conversion.binary_prefixes[index][:1]}{suffix}"
+
 
+def network_is_reachable() -> bool:
+    """
+    Check for a working connection by opening a TCP connection to a public
+    DNS server. A success is reused for reachable_ttl seconds.
+    """
+    global last_reachable
+
+    if last_reachable and time.monotonic() - last_reachable < reachable_ttl:
+        return True
 
-def network_is_reachable():
     host = "8.8.8.8"
     port = 53
     timeout = 3
     try:
-        socket.setdefaulttimeout(timeout)
-        with socket.create_connection((host, port)):
-            return True
+        # Connecting a UDP socket sends nothing, it only consults the routing
+        # table, so a missing route fails here without waiting for the timeout
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp:
+            udp.connect((host, port))
+        # The host is a literal address, so connect directly rather than going
+        # through create_connection's getaddrinfo lookup
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as tcp:
+            tcp.settimeout(timeout)
+            if tcp.connect_ex((host, port)) == 0:
+                last_reachable = time.monotonic()
+                return True
     except OSError:
-        return False
+        pass
+
+    last_reachable = 0.0
+    return False
 
 
 def ip_to_location(ip: str) -> LocationData | None:
+    """
+    Look up the location of an IP address. Successful lookups are reused for
+    lookup_ttl seconds.
+    """
+    cached = location_cache.get(ip)
+    if cached and time.monotonic() - cached[0] < lookup_ttl:
+        return cached[1]
+
     location_data: LocationData = LocationData()
     response = http.request(
         method="GET",
         url=f"https://ipinfo.io/{ip}/json",
     )
 
-    if response and response.status == 200 and response.body:
-        json_data = cast(dict[str, str], json.loads(response.body))
+    if response and response.status == 200 and isinstance(response.body, dict):
+        json_data = cast(dict[str, str], response.body)
         location_data = from_dict(
-            data_class=LocationData, data=json_data, config=Config(cast=[str])
+            data_class=LocationData, data=json_data, config=dacite_config
         )
+        location_cache[ip] = (time.monotonic(), location_data)
         return location_data
     return None
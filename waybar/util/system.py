@@ -1,5 +1,4 @@
 import getpass
-import json
 import logging
 import os
 import platform
@@ -8,13 +7,20 @@ import shlex
 import shutil
 import signal
 import subprocess
+import sys
 from collections import namedtuple
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
-from typing import Any, Tuple, cast
+from typing import Any, Tuple
+
+import orjson
 
 from waybar import glyphs
 
+resolved_binaries: dict[str, str] = {}
+
 
 class LevelPadFormatter(logging.Formatter):
     LEVEL_WIDTH = len("WARNING")
@@ -64,15 +70,27 @@ def configure_logger(debug: bool, name: str, logfile: Path) -> logging.Logger:
 
 def error_exit(icon: str, message: str):
     print(
-        json.dumps(
+        orjson.dumps(
             {
                 "text": f"{icon} {message}",
                 "class": "error",
             }
-        )
+        ).decode()
     )
 
 
+def emit(output: Mapping[str, object] | bytes):
+    """
+    Write one status line to waybar as UTF-8 JSON bytes and flush it.
+    Pre-serialized lines are written as they are.
+    """
+    if not isinstance(output, bytes):
+        output = orjson.dumps(output, option=orjson.OPT_APPEND_NEWLINE)
+    _ = sys.stdout.buffer.write(output)
+    sys.stdout.buffer.flush()
+
+
+@cache
 def get_cache_directory() -> Path:
     xdg_cache = os.environ.get("XDG_CACHE_HOME")
     if xdg_cache:
@@ -89,6 +107,7 @@ def get_cache_directory() -> Path:
     return cache_dir
 
 
+@cache
 def get_config_directory() -> str:
     return os.path.join(
         Path.home(),
@@ -97,6 +116,7 @@ def get_config_directory() -> str:
     )
 
 
+@cache
 def get_script_directory() -> str:
     return os.path.join(
         get_config_directory(),
@@ -108,10 +128,17 @@ def parse_version(version_string: str):
     """
     Parse a version string and return a namedtuple containing all of the bits.
     """
-    fields = [f"part{i + 1}" for i in range(len(version_string.split(".")))]
-    version = namedtuple("version", fields)
-    parts = map(int, version_string.split("."))
-    return version(*parts)
+    parts = version_string.split(".")
+    return version_class(len(parts))(*map(int, parts))
+
+
+@cache
+def version_class(size: int) -> type:
+    """
+    Return the version namedtuple class with the given number of parts. namedtuple
+    generates and execs source for every class, so build each shape only once.
+    """
+    return namedtuple("version", [f"part{i + 1}" for i in range(size)])
 
 
 def get_signal_map() -> dict[str, signal.Signals]:
@@ -210,21 +237,42 @@ def run_piped_command(
         - If background=False: (return_code, stdout, stderr)
         - If background=True : list of Popen objects (pipeline)
     """
-    # Split pipeline into stages
+    # Split pipeline into stages and resolve every binary up front, so a
+    # missing one fails before any stage has been started
     parts = [shlex.split(cmd.strip()) for cmd in command.split("|")]
+    binaries: list[str] = []
+    for part in parts:
+        binary = resolve_binary(part[0]) if part else None
+        if binary is None:
+            missing = part[0] if part else command
+            return 1, None, FileNotFoundError(f"No such file or directory: {missing!r}")
+        binaries.append(binary)
+
+    if len(parts) == 1 and not background:
+        completed = subprocess.run(
+            parts[0], executable=binaries[0], capture_output=True
+        )
+        return (
+            completed.returncode,
+            completed.stdout.decode().strip(),
+            completed.stderr.decode().strip(),
+        )
+
     processes: list[subprocess.Popen[bytes]] = []
     prev_stdout = None
 
     for i, part in enumerate(parts):
         try:
+            # process_group rather than preexec_fn keeps the fast vfork path
             proc = subprocess.Popen(
                 part,
+                executable=binaries[i],
                 stdin=prev_stdout,
                 stdout=subprocess.PIPE if not background else subprocess.DEVNULL,
                 stderr=subprocess.PIPE
                 if not background and i == len(parts) - 1
                 else subprocess.DEVNULL,
-                preexec_fn=os.setpgrp if background else None,
+                process_group=0 if background else None,
             )
 
             if prev_stdout:
@@ -323,10 +371,31 @@ def find_partitions() -> list[Mountpoint]:
     return partitions
 
 
+@cache
+def get_username() -> str:
+    """
+    Return the current user's name, which is fixed for the life of the process.
+    """
+    return getpass.getuser()
+
+
 def which(binary_name: str) -> str | None:
     return shutil.which(binary_name)
 
 
+def resolve_binary(binary_name: str) -> str | None:
+    """
+    Return the full path to a binary. Found paths are remembered; a miss is
+    looked up again next time, so a binary installed later is still found.
+    """
+    path = resolved_binaries.get(binary_name)
+    if path is None:
+        path = which(binary_name)
+        if path:
+            resolved_binaries[binary_name] = path
+    return path
+
+
 def get_process_icon(
     theme: str, process_owner: str, click_to_kill: bool = False
 ) -> Tuple[str, str]:
@@ -334,7 +403,7 @@ def get_process_icon(
     Return a skull icon if a process can be killed or a no entry sign icon if it cannot.
     """
     if click_to_kill:
-        if process_owner == getpass.getuser():
+        if process_owner == get_username():
             return (glyphs.fa_skull_crossbones, "")
         else:
             return (
@@ -345,17 +414,18 @@ def get_process_icon(
         return "", "#808080" if theme == "light" else "#C0C0C0"
 
 
+@cache
 def get_distro_icon() -> str:
-    command = "cat /etc/os-release | jc --pretty --os-release"
-    rc, stdout_raw, _ = run_piped_command(command)
-
-    stdout = stdout_raw if isinstance(stdout_raw, str) else ""
-
-    if rc == 0 and stdout:
-        json_data = cast(dict[str, str], json.loads(stdout))
-        if "ID" in json_data:
-            distro_id = json_data["ID"]
-            if distro_id in glyphs.distro_map:
-                return glyphs.distro_map[distro_id]
+    # os-release is a plain KEY=VALUE file; /usr/lib/os-release is its fallback
+    for filename in ("/etc/os-release", "/usr/lib/os-release"):
+        try:
+            with open(filename, "r") as fh:
+                for line in fh:
+                    if line.startswith("ID="):
+                        distro_id = line[3:].strip().strip("\"'")
+                        return glyphs.distro_map.get(distro_id, glyphs.md_linux)
+            break
+        except OSError:
+            continue
 
     return glyphs.md_linux
@@ -1,12 +1,10 @@
-import re
 import time
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 
 
 def get_human_timestamp() -> str:
-    now = int(time.time())
-    dt = datetime.fromtimestamp(now)
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
 def to_24hour_time(input: int) -> str | None:
@@ -22,25 +20,38 @@ def to_24hour_time(input: int) -> str | None:
 
 def to_unix_time(input: str | None) -> int:
     if input:
-        pattern = r"^(0[1-9]|1[0-2]):[0-5][0-9] (AM|PM)$"
-        if re.match(pattern, input):
-            try:
-                # Parse as 12-hour format
-                dt = datetime.strptime(input, "%I:%M %p")
-
-                # Replace today's date with the parsed time
-                now = datetime.now()
-                dt = dt.replace(year=now.year, month=now.month, day=now.day)
-
-                # Convert to Unix timestamp (local time)
-                return int(time.mktime(dt.timetuple()))
-            except Exception:
-                return 0
-        else:
-            return 0
+        return _unix_time_on(input=input, day=date.today())
     return 0
 
 
+@lru_cache(maxsize=1024)
+def _unix_time_on(input: str, day: date) -> int:
+    """
+    Convert a 12-hour time on the given day to a Unix timestamp. The day is
+    part of the cache key, so cached results never outlive their date.
+    """
+    try:
+        # Parse as 12-hour format; strptime rejects anything else
+        dt = datetime.strptime(input, "%I:%M %p")
+
+        # Replace the placeholder date with the requested one
+        dt = dt.replace(year=day.year, month=day.month, day=day.day)
+
+        # Convert to Unix timestamp (local time)
+        return int(dt.timestamp())
+    except ValueError:
+        return 0
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(input: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp. The same dates recur across API payloads, so
+    the results are cached; datetime objects are immutable and safe to share.
+    """
+    return datetime.fromisoformat(input)
+
+
 def unix_to_human(timestamp, format: str = "%Y-%m-%d") -> str:
     """
     Take a Unix timestamp and convert it to the specified format.
@@ -63,11 +74,9 @@ def get_timestamp(timestamp: int = 0, format: str = "%Y-%m-%d %k:%M:%S") -> str:
 
 
 def duration(seconds: int = 0) -> tuple[int, int, int, int]:
-    seconds = int(seconds)
-    days = int(seconds / 86400)
-    hours = int(((seconds - (days * 86400)) / 3600))
-    minutes = int(((seconds - days * 86400 - hours * 3600) / 60))
-    secs = int((seconds - (days * 86400) - (hours * 3600) - (minutes * 60)))
+    days, remainder = divmod(int(seconds), 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, secs = divmod(remainder, 60)
 
     return days, hours, minutes, secs
 
@@ -1,33 +1,49 @@
 #!/usr/bin/env python3
 
-import json
+import hashlib
 import logging
 import os
 import signal
-import sys
 import threading
 import time
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from pathlib import Path
 from typing import cast
 
 import click
+import orjson
 from dacite import Config, from_dict
 
 from waybar import glyphs, http
 from waybar.data import weather
 from waybar.util import log, network, system, wtime
 
-sys.stdout.reconfigure(line_buffering=True)  # type: ignore
-
-
 cache_dir = system.get_cache_directory()
+celsius_units = (
+    "km",
+    "C",
+    "kph",
+    attrgetter("dewpoint_c", "feelslike_c", "vis_km", "wind_kph"),
+    attrgetter("maxtemp_c", "mintemp_c"),
+)
 condition = threading.Condition()
 context_settings = dict(help_option_names=["-h", "--help"])
+dacite_config = Config(cast=[int, str], check_types=False)
+fahrenheit_units = (
+    "miles",
+    "F",
+    "mph",
+    attrgetter("dewpoint_f", "feelslike_f", "vis_miles", "wind_mph"),
+    attrgetter("maxtemp_f", "mintemp_f"),
+)
 format_index: int = 0
+last_fetch: float = 0.0
 logger: logging.Logger
 logfile = cache_dir / "waybar-weather.log"
 needs_fetch: bool = False
 needs_redraw: bool = False
+response_cache_ttl = 240
 weather_data: list[weather.LocationData] | None = []
 
 formats: list[int] = []
@@ -36,12 +52,16 @@ update_event = threading.Event()
 
 
 def refresh_handler(_signum: int, _frame: object | None):
-    global needs_fetch, needs_redraw, logger
+    global last_fetch, needs_fetch, needs_redraw, logger
     logger.info("received SIGHUP — re-fetching data")
+    clear_cached_responses()
     with condition:
+        last_fetch = time.monotonic()
         needs_fetch = True
         needs_redraw = True
         condition.notify()
+    # Wake main so the next scheduled fetch counts from this one
+    update_event.set()
 
 
 def toggle_format(_signum: int, _frame: object | None):
@@ -65,35 +85,21 @@ def generate_tooltip(location_data: weather.LocationData, use_celsius: bool):
     global logger
 
     logger.debug(f"entering with mountpoint={location_data.location_full}")
-    tooltip: list[str] = []
-    tooltip_od: OrderedDict[str, str | int | float] = OrderedDict()
-
-    if use_celsius:
-        distance = "km"
-        unit = "C"
-        speed = "kph"
-        dewpoint = location_data.weather.current.dewpoint_c
-        feels_like = location_data.weather.current.feelslike_c
-        max_temp = location_data.weather.forecast.forecastday[0].day.maxtemp_c
-        min_temp = location_data.weather.forecast.forecastday[0].day.mintemp_c
-        visibility = location_data.weather.current.vis_km
-        wind_speed = location_data.weather.current.wind_kph
-    else:
-        distance = "miles"
-        unit = "F"
-        speed = "mph"
-        dewpoint = location_data.weather.current.dewpoint_f
-        feels_like = location_data.weather.current.feelslike_f
-        max_temp = location_data.weather.forecast.forecastday[0].day.maxtemp_f
-        min_temp = location_data.weather.forecast.forecastday[0].day.mintemp_f
-        visibility = location_data.weather.current.vis_miles
-        wind_speed = location_data.weather.current.wind_mph
-
-    sunrise_unix = location_data.weather.forecast.forecastday[0].astro.sunrise_unix
-    sunset_unix = location_data.weather.forecast.forecastday[0].astro.sunset_unix
-    moonrise_unix = location_data.weather.forecast.forecastday[0].astro.moonrise_unix
-    moonset_unix = location_data.weather.forecast.forecastday[0].astro.moonset_unix
-    moon_phase = location_data.weather.forecast.forecastday[0].astro.moon_phase
+    tooltip_od: dict[str, str | int | float] = {}
+
+    distance, unit, speed, current_fields, day_fields = (
+        celsius_units if use_celsius else fahrenheit_units
+    )
+    current = location_data.weather.current
+    today = location_data.weather.forecast.forecastday[0]
+    dewpoint, feels_like, visibility, wind_speed = current_fields(current)
+    max_temp, min_temp = day_fields(today.day)
+
+    sunrise_unix = today.astro.sunrise_unix
+    sunset_unix = today.astro.sunset_unix
+    moonrise_unix = today.astro.moonrise_unix
+    moonset_unix = today.astro.moonset_unix
+    moon_phase = today.astro.moon_phase
 
     if location_data.location_full:
         tooltip_od["Location"] = location_data.location_full
@@ -146,12 +152,8 @@ def generate_tooltip(location_data: weather.LocationData, use_celsius: bool):
     if moon_phase:
         tooltip_od["Moon Phase"] = moon_phase
 
-    max_key_length = 0
-    for key in tooltip_od.keys():
-        max_key_length = len(key) if len(key) > max_key_length else max_key_length
-
-    for key, value in tooltip_od.items():
-        tooltip.append(f"{key:{max_key_length}} : {value}")
+    max_key_length = max(map(len, tooltip_od), default=0)
+    tooltip = [f"{key:{max_key_length}} : {value}" for key, value in tooltip_od.items()]
 
     if len(tooltip) > 0:
         tooltip.append("")
@@ -160,102 +162,91 @@ def generate_tooltip(location_data: weather.LocationData, use_celsius: bool):
     return "\n".join(tooltip)
 
 
+# https://www.weatherapi.com/docs/weather_conditions.json
+# condition code -> (day icon, night icon)
+weather_icons: dict[int, tuple[str, str]] = {
+    # Sunny
+    1000: (glyphs.md_weather_sunny, glyphs.md_weather_night),
+    # Partly cloudy
+    1003: (glyphs.md_weather_partly_cloudy, glyphs.md_weather_night_partly_cloudy),
+    # Cloudy
+    1006: (glyphs.weather_day_cloudy, glyphs.weather_night_cloudy),
+    # Overcast
+    1009: (glyphs.weather_day_sunny_overcast, glyphs.weather_night_cloudy),
+    # Mist
+    1030: (glyphs.md_weather_hazy, glyphs.md_weather_hazy),
+    # Patchy rain possible
+    1063: (glyphs.md_weather_partly_rainy, glyphs.md_weather_partly_rainy),
+    # Patchy snow possible
+    1066: (glyphs.md_weather_partly_snowy, glyphs.md_weather_partly_snowy),
+    # Blowing snow
+    1114: (glyphs.weather_snow_wind, glyphs.weather_day_snow_wind),
+    # Patchy sleet possible / Light sleet / Light sleet showers
+    1069: (glyphs.weather_day_sleet, glyphs.weather_night_sleet),
+    1204: (glyphs.weather_day_sleet, glyphs.weather_night_sleet),
+    1249: (glyphs.weather_day_sleet, glyphs.weather_night_sleet),
+    # Moderate or heavy sleet / Moderate or heavy sleet showers
+    1207: (glyphs.weather_day_sleet_storm, glyphs.weather_night_alt_sleet_storm),
+    1252: (glyphs.weather_day_sleet_storm, glyphs.weather_night_alt_sleet_storm),
+    # Patchy light snow / Light snow / Patchy moderate snow / Moderate snow /
+    # Patchy heavy snow / Heavy snow
+    1210: (glyphs.weather_day_snow, glyphs.weather_night_snow),
+    1213: (glyphs.weather_day_snow, glyphs.weather_night_snow),
+    1216: (glyphs.weather_day_snow, glyphs.weather_night_snow),
+    1219: (glyphs.weather_day_snow, glyphs.weather_night_snow),
+    1222: (glyphs.weather_day_snow, glyphs.weather_night_snow),
+    1225: (glyphs.weather_day_snow, glyphs.weather_night_snow),
+    # Light rain shower
+    1240: (glyphs.weather_day_rain, glyphs.weather_night_rain),
+    # Moderate or heavy rain shower
+    1243: (glyphs.weather_day_showers, glyphs.weather_night_showers),
+    # Torrential rain shower
+    1246: (glyphs.weather_day_storm_showers, glyphs.weather_night_storm_showers),
+}
+
+
 def get_weather_icon(condition_code: int, is_day: bool) -> str:
-    # https://www.weatherapi.com/docs/weather_conditions.json
-    if condition_code == 1000:  # Sunny
-        if is_day == 1:
-            return glyphs.md_weather_sunny
-        else:
-            return glyphs.md_weather_night
-
-    elif condition_code == 1003:
-        if is_day == 1:  # Partly cloudy
-            return glyphs.md_weather_partly_cloudy
-        else:
-            return glyphs.md_weather_night_partly_cloudy
-
-    elif condition_code == 1006:  # Cloudy
-        if is_day == 1:
-            return glyphs.weather_day_cloudy
-        else:
-            return glyphs.weather_night_cloudy
-
-    elif condition_code == 1009:  # Overcast
-        if is_day == 1:
-            return glyphs.weather_day_sunny_overcast
-        else:
-            return glyphs.weather_night_cloudy
-
-    elif condition_code == 1030:  # Mist
-        if is_day == 1:
-            return glyphs.md_weather_hazy
-        else:
-            return glyphs.md_weather_hazy
-
-    elif condition_code == 1063:  # Patchy rain possible
-        if is_day == 1:
-            return glyphs.md_weather_partly_rainy
-        else:
-            return glyphs.md_weather_partly_rainy
-
-    elif condition_code == 1066:  # Patchy snow possible
-        if is_day == 1:
-            return glyphs.md_weather_partly_snowy
-        else:
-            return glyphs.md_weather_partly_snowy
-
-    elif condition_code == 1114:  # Blowing snow
-        if is_day == 1:
-            return glyphs.weather_snow_wind
-        else:
-            return glyphs.weather_day_snow_wind
-
-    elif condition_code in [
-        1069,
-        1204,
-        1249,
-    ]:  # Patchy sleet possible / Light sleet /Light sleet showers
-        if is_day == 1:
-            return glyphs.weather_day_sleet
-        else:
-            return glyphs.weather_night_sleet
-
-    elif condition_code in [
-        1207,
-        1252,
-    ]:  # Moderate or heavy sleet / Moderate or heavy sleet showers
-        if is_day == 1:
-            return glyphs.weather_day_sleet_storm
-        else:
-            return glyphs.weather_night_alt_sleet_storm
-
-    elif (
-        condition_code in [1210, 1213, 1216, 1219, 1222, 1225]
-    ):  # Patchy light snow / Light snow / Patchy moderate snow / Moderate snow / Patchy heavy snow / Heavy snow
-        if is_day == 1:
-            return glyphs.weather_day_snow
-        else:
-            return glyphs.weather_night_snow
-
-    elif condition_code == 1240:  # Light rain shower
-        if is_day == 1:
-            return glyphs.weather_day_rain
-        else:
-            return glyphs.weather_night_rain
-
-    elif condition_code == 1243:  # Moderate or heavy rain shower
-        if is_day == 1:
-            return glyphs.weather_day_showers
-        else:
-            return glyphs.weather_night_showers
-
-    elif condition_code == 1246:  # Torrential rain shower
-        if is_day == 1:
-            return glyphs.weather_day_storm_showers
-        else:
-            return glyphs.weather_night_storm_showers
-
-    return glyphs.md_weather_sunny
+    day, night = weather_icons.get(
+        condition_code, (glyphs.md_weather_sunny, glyphs.md_weather_sunny)
+    )
+    return day if is_day == 1 else night
+
+
+def response_cache_file(location: str) -> Path:
+    key = hashlib.blake2b(location.encode("utf-8"), digest_size=8).hexdigest()
+    return cache_dir / f"waybar-weather-{key}.json"
+
+
+def load_cached_response(location: str) -> dict[str, object] | None:
+    """
+    Return the last API response for a location if the cache file is still fresh.
+    """
+    filename = response_cache_file(location=location)
+    try:
+        if time.time() - os.path.getmtime(filename) >= response_cache_ttl:
+            return None
+        return cast(dict[str, object], orjson.loads(filename.read_bytes()))
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_response(location: str, body: dict[str, object]):
+    filename = response_cache_file(location=location)
+    try:
+        _ = filename.write_bytes(orjson.dumps(body))
+    except OSError as e:
+        logger.error(f"failed to write {filename}: {e}")
+
+
+def clear_cached_responses():
+    """
+    Forget every cached API response so the next fetch goes to the network.
+    """
+    for filename in cache_dir.glob("waybar-weather-*.json"):
+        try:
+            filename.unlink(missing_ok=True)
+        except OSError as e:
+            logger.error(f"failed to remove {filename}: {e}")
 
 
 def get_weather(api_key: str, location: str) -> weather.LocationData:
@@ -264,63 +255,53 @@ def get_weather(api_key: str, location: str) -> weather.LocationData:
     logger.info(f"entering function with location={location}")
 
     location_data: weather.LocationData = weather.LocationData()
-    response = http.request(
-        method="GET",
-        url="https://api.weatherapi.com/v1/forecast.json",
-        params={
-            "key": api_key,
-            "q": location,
-            "aqi": "no",
-            "alerts": "no",
-        },
-    )
-    if response:
-        if response.status == 200:
-            if response.body:
-                json_data = cast(dict[str, object], json.loads(response.body))
-                weather_data = from_dict(
-                    data_class=weather.WeatherData,
-                    data=json_data,
-                    config=Config(cast=[int, str]),
-                )
+    json_data = load_cached_response(location=location)
+    if json_data is None:
+        response = http.request(
+            method="GET",
+            url="https://api.weatherapi.com/v1/forecast.json",
+            params={
+                "key": api_key,
+                "q": location,
+                "aqi": "no",
+                "alerts": "no",
+            },
+        )
+        if response and response.status == 200 and isinstance(response.body, dict):
+            json_data = cast(dict[str, object], response.body)
+            save_cached_response(location=location, body=json_data)
+    else:
+        logger.info(f"using the cached response for location={location}")
 
-                for idx, _ in enumerate(weather_data.forecast.forecastday):
-                    if weather_data.forecast.forecastday[idx].astro.moonrise:
-                        weather_data.forecast.forecastday[
-                            idx
-                        ].astro.moonrise_unix = wtime.to_unix_time(
-                            input=weather_data.forecast.forecastday[idx].astro.moonrise
-                        )
-                    if weather_data.forecast.forecastday[idx].astro.moonset:
-                        weather_data.forecast.forecastday[
-                            idx
-                        ].astro.moonset_unix = wtime.to_unix_time(
-                            input=weather_data.forecast.forecastday[idx].astro.moonset
-                        )
-                    if weather_data.forecast.forecastday[idx].astro.sunrise:
-                        weather_data.forecast.forecastday[
-                            idx
-                        ].astro.sunrise_unix = wtime.to_unix_time(
-                            input=weather_data.forecast.forecastday[idx].astro.sunrise
-                        )
-                    if weather_data.forecast.forecastday[idx].astro.sunset:
-                        weather_data.forecast.forecastday[
-                            idx
-                        ].astro.sunset_unix = wtime.to_unix_time(
-                            input=weather_data.forecast.forecastday[idx].astro.sunset
-                        )
-
-                return weather.LocationData(
-                    success=True,
-                    icon=get_weather_icon(
-                        condition_code=weather_data.current.condition.code,
-                        is_day=True if weather_data.current.is_day == 1 else False,
-                    ),
-                    location_short=weather_data.location.name,
-                    location_full=location,
-                    weather=weather_data,
-                    updated=wtime.get_human_timestamp(),
-                )
+    if json_data is not None:
+        weather_data = from_dict(
+            data_class=weather.WeatherData,
+            data=json_data,
+            config=dacite_config,
+        )
+
+        for forecast_day in weather_data.forecast.forecastday:
+            astro = forecast_day.astro
+            if astro.moonrise:
+                astro.moonrise_unix = wtime.to_unix_time(input=astro.moonrise)
+            if astro.moonset:
+                astro.moonset_unix = wtime.to_unix_time(input=astro.moonset)
+            if astro.sunrise:
+                astro.sunrise_unix = wtime.to_unix_time(input=astro.sunrise)
+            if astro.sunset:
+                astro.sunset_unix = wtime.to_unix_time(input=astro.sunset)
+
+        return weather.LocationData(
+            success=True,
+            icon=get_weather_icon(
+                condition_code=weather_data.current.condition.code,
+                is_day=True if weather_data.current.is_day == 1 else False,
+            ),
+            location_short=weather_data.location.name,
+            location_full=location,
+            weather=weather_data,
+            updated=wtime.get_human_timestamp(),
+        )
 
     return location_data
 
@@ -370,23 +351,38 @@ def worker(api_key: str, locations: list[str], use_celsius: bool):
                 "class": "error",
                 "tooltip": "Weather update error",
             }
-            print(json.dumps(output))
+            system.emit(output)
             continue
 
         if fetch:
-            weather_data = []
-            for location in locations:
-                print(
-                    json.dumps(
-                        {
-                            "text": f"{glyphs.md_timer_outline}{glyphs.icon_spacer}Fetching {location}...",
-                            "class": "loading",
-                            "tooltip": f"Fetching {location}...",
-                        }
+            # The locations are fetched together, so show one loading line for all
+            # of them rather than one per location that would be overwritten at once
+            fetching = (
+                f"Fetching {locations[0]}..."
+                if len(locations) == 1
+                else f"Fetching {len(locations)} locations..."
+            )
+            system.emit(
+                {
+                    "text": f"{glyphs.md_timer_outline}{glyphs.icon_spacer}{fetching}",
+                    "class": "loading",
+                    "tooltip": "\n".join(
+                        f"Fetching {location}..." for location in locations
+                    ),
+                }
+            )
+
+            # Each location is a separate API round trip, so fetch them together;
+            # map() keeps the results in the same order as the locations
+            with ThreadPoolExecutor(max_workers=len(locations)) as executor:
+                weather_data = list(
+                    executor.map(
+                        lambda location: get_weather(
+                            api_key=api_key, location=location
+                        ),
+                        locations,
                     )
                 )
-                location_data = get_weather(api_key=api_key, location=location)
-                weather_data.append(location_data)
 
         if weather_data and len(weather_data) > 0:
             if redraw:
@@ -401,7 +397,7 @@ def worker(api_key: str, locations: list[str], use_celsius: bool):
                     "class": output_class,
                     "tooltip": tooltip,
                 }
-                print(json.dumps(output))
+                system.emit(output)
 
 
 @click.command(
@@ -438,12 +434,16 @@ def main(
     test: bool,
     debug: bool,
 ):
-    global formats, needs_fetch, needs_redraw, logger
+    global formats, last_fetch, needs_fetch, needs_redraw, logger, response_cache_ttl
 
     logger = log.configure(
         debug=debug, name=os.path.basename(__file__), logfile=logfile
     )
 
+    # Keep cached responses for at most half an interval, so every timer poll
+    # still reaches the API however short the interval is
+    response_cache_ttl = min(response_cache_ttl, interval // 2)
+
     formats = list(range(len(location)))
 
     logger.info("entering function")
@@ -471,13 +471,21 @@ def main(
     ).start()
 
     with condition:
+        last_fetch = time.monotonic()
         needs_fetch = True
         needs_redraw = True
         condition.notify()
 
     while True:
-        time.sleep(interval)
+        # A SIGHUP sets update_event and moves last_fetch, so loop round to
+        # wait out the rest of the interval from the new fetch instead
+        remaining = last_fetch + interval - time.monotonic()
+        if update_event.wait(timeout=max(remaining, 0)):
+            update_event.clear()
+            continue
+
         with condition:
+            last_fetch = time.monotonic()
             needs_fetch = True
             needs_redraw = True
             condition.notify()